@@ -0,0 +1,218 @@
+"""Super Ball 平衡参数扫描
+
+在多进程池中对游戏常量做网格搜索或随机搜索。每个参数点用 superball_engine
+并行模拟若干局由脚本玩家操作的游戏，统计存活时间分布。结果按参数哈希缓存
+在磁盘上，重复运行时跳过已完成的点。
+
+示例:
+    python balance_sweep.py --grid base_speed=10,12,14 --grid attack_range=60,80,100
+    python balance_sweep.py --random 40 --range max_speed=20:40 --range stun_duration=15:60
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import superball_engine as engine
+
+# 允许扫描的参数；整数参数按整数取值
+SWEEP_PARAMS = {
+    "base_speed": float,
+    "max_speed": float,
+    "speed_increment": float,
+    "stun_duration": int,
+    "slow_duration": int,
+    "attack_range": float,
+}
+
+# 脚本玩家或规则变化时递增，使旧缓存失效
+POLICY_VERSION = 1
+
+def scripted_policy(games):
+    """脚本玩家：球进入攻击范围就出矛，球靠近时远离并在来球时起跳"""
+    p = games.params
+    np = engine.np
+    dx = games.ball_x - games.player_x
+    dy = games.ball_y - games.player_y
+    dist = np.sqrt(dx * dx + dy * dy)
+
+    keys = np.zeros(games.count, dtype=np.int32)
+    keys |= np.where((dist <= p["attack_range"]) & (games.attack_cooldown <= 0), engine.KEY_ATTACK, 0)
+
+    # 远离球；被逼到墙边时反向冲过去
+    flee_left = dx > 0
+    near_wall = np.where(flee_left, games.player_x < 80, games.player_x > p["width"] - 80)
+    go_left = flee_left ^ near_wall
+    threatened = np.abs(dx) < 250
+    keys |= np.where(threatened & go_left, engine.KEY_LEFT, 0)
+    keys |= np.where(threatened & ~go_left, engine.KEY_RIGHT, 0)
+
+    approaching = dx * games.ball_vx < 0
+    keys |= np.where(approaching & (dist < 120) & (dy > -150) & (games.stun <= 0), engine.KEY_JUMP, 0)
+    return keys
+
+def point_key(point):
+    """参数点的缓存键"""
+    blob = json.dumps(
+        {"point": point, "policy": POLICY_VERSION, "defaults": engine.DEFAULT_PARAMS},
+        sort_keys=True,
+    )
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()[:24]
+
+def run_point(point):
+    """在子进程中模拟一个参数点，返回每局存活帧数"""
+    games = engine.VectorGames(
+        point["games"],
+        point["params"],
+        seeds=engine.np.arange(point["seed"], point["seed"] + point["games"]),
+    )
+    start = time.perf_counter()
+    ticks = games.run(scripted_policy, point["ticks"])
+    return {
+        "params": point["params"],
+        "survival_ticks": ticks.tolist(),
+        "elapsed": time.perf_counter() - start,
+    }
+
+def summarize(result, max_ticks):
+    """计算存活时间分布（秒）"""
+    survival = sorted(result["survival_ticks"])
+    n = len(survival)
+
+    def percentile(q):
+        return survival[min(n - 1, int(q * n))] / engine.TICKS_PER_SECOND
+
+    buckets = [0] * 10
+    for t in survival:
+        buckets[min(9, t * 10 // max_ticks)] += 1
+    return {
+        "params": result["params"],
+        "games": n,
+        "mean": sum(survival) / n / engine.TICKS_PER_SECOND,
+        "p10": percentile(0.10),
+        "p50": percentile(0.50),
+        "p90": percentile(0.90),
+        "survived": sum(1 for t in survival if t >= max_ticks) / n,
+        "histogram": buckets,
+    }
+
+def parse_grid(specs):
+    """解析 name=v1,v2,... 形式的网格定义"""
+    axes = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in SWEEP_PARAMS or not values:
+            raise ValueError(f"无效的网格参数: {spec}")
+        axes[name] = [SWEEP_PARAMS[name](v) for v in values.split(",")]
+    names = list(axes)
+    return [dict(zip(names, combo)) for combo in itertools.product(*axes.values())]
+
+def parse_random(specs, count, seed):
+    """解析 name=lo:hi 形式的范围定义并随机采样"""
+    ranges = {}
+    for spec in specs:
+        name, _, bounds = spec.partition("=")
+        lo, _, hi = bounds.partition(":")
+        if name not in SWEEP_PARAMS or not hi:
+            raise ValueError(f"无效的范围参数: {spec}")
+        ranges[name] = (float(lo), float(hi))
+    rng = random.Random(seed)
+    points = []
+    for _ in range(count):
+        point = {}
+        for name, (lo, hi) in ranges.items():
+            kind = SWEEP_PARAMS[name]
+            point[name] = rng.randint(int(lo), int(hi)) if kind is int else round(rng.uniform(lo, hi), 3)
+        points.append(point)
+    return points
+
+def load_cached(cache_dir, key):
+    path = os.path.join(cache_dir, key + ".json")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def store_cached(cache_dir, key, result):
+    path = os.path.join(cache_dir, key + ".json")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+    os.replace(tmp_path, path)
+
+def sweep(param_sets, games=1000, ticks=7200, seed=0, workers=None, cache_dir=".sweep_cache", progress=print):
+    """运行一组参数点，返回每个点的存活分布摘要（顺序与输入一致）"""
+    os.makedirs(cache_dir, exist_ok=True)
+    points = [
+        {"params": engine.make_params(overrides), "games": games, "ticks": ticks, "seed": seed}
+        for overrides in param_sets
+    ]
+    keys = [point_key(point) for point in points]
+    results = [load_cached(cache_dir, key) for key in keys]
+    todo = [i for i, result in enumerate(results) if result is None]
+    progress(f"{len(points)} 个参数点, {len(points) - len(todo)} 个命中缓存, {len(todo)} 个待模拟")
+
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run_point, points[i]): i for i in todo}
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                results[i] = future.result()
+                store_cached(cache_dir, keys[i], results[i])
+                progress(f"[{done}/{len(todo)}] {param_sets[i]} ({results[i]['elapsed']:.1f}s)")
+
+    return [
+        dict(summarize(result, ticks), overrides=overrides)
+        for overrides, result in zip(param_sets, results)
+    ]
+
+def format_table(summaries):
+    """把摘要格式化为文本表格"""
+    lines = [f"{'parameters':<48} {'mean':>6} {'p10':>6} {'p50':>6} {'p90':>6} {'alive':>6}"]
+    for s in summaries:
+        label = " ".join(f"{k}={v}" for k, v in s["overrides"].items()) or "(defaults)"
+        lines.append(
+            f"{label:<48} {s['mean']:6.1f} {s['p10']:6.1f} {s['p50']:6.1f} {s['p90']:6.1f} {s['survived']:6.1%}"
+        )
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Super Ball balance parameter sweep")
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2",
+                        help="网格轴，可重复；参数: " + ", ".join(SWEEP_PARAMS))
+    parser.add_argument("--random", type=int, default=0, metavar="N", help="随机搜索的点数")
+    parser.add_argument("--range", action="append", default=[], metavar="NAME=LO:HI", help="随机搜索范围，可重复")
+    parser.add_argument("--games", type=int, default=1000, help="每个参数点模拟的局数")
+    parser.add_argument("--ticks", type=int, default=int(120 * engine.TICKS_PER_SECOND), help="每局最多模拟的帧数")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="进程数（默认全部CPU）")
+    parser.add_argument("--cache-dir", default=".sweep_cache")
+    parser.add_argument("--output", help="将摘要写入JSON文件")
+    args = parser.parse_args(argv)
+
+    if engine.np is None:
+        parser.error("参数扫描需要 NumPy: pip install numpy")
+
+    try:
+        if args.random:
+            param_sets = parse_random(args.range, args.random, args.seed)
+        else:
+            param_sets = parse_grid(args.grid) if args.grid else [{}]
+    except ValueError as e:
+        parser.error(str(e))
+
+    summaries = sweep(param_sets, args.games, args.ticks, args.seed, args.workers, args.cache_dir)
+    print(format_table(summaries))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(summaries, f, indent=4, ensure_ascii=False)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
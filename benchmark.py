@@ -0,0 +1,390 @@
+"""Super Ball 启动器性能基准
+
+对启动器的热点路径计时：配置读写、会话统计、游戏目录搜索、游戏文件夹增量扫描、统计面板刷新、
+主题刷新、游戏库滚动以及 GameLauncher 的构造。每个用例先预热，再在关闭垃圾回收的情况下重复运行，报告
+中位数和 p95。用例在临时目录中运行，不会改动真实的配置和会话日志。
+
+依赖 Tk 的用例需要图形显示：没有 $DISPLAY 时会尝试启动 Xvfb，仍然不可用则跳过。临时目录中
+复制了游戏模板和字符串表，界面用例会等到 finish_startup（编译页面、游戏目录、文件校验等）
+完成后才开始计时。
+
+示例:
+    python benchmark.py                                  # 运行并输出结果
+    python benchmark.py --save-baseline bench_baseline.json
+    python benchmark.py --baseline bench_baseline.json   # 与基线比较，变慢时退出码为 1
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+CASES = []
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+GAME_DIR = "super_ball-HTMLfile"
+
+def case(name, repeat=200, needs_tk=False):
+    """注册基准用例：被装饰的函数接收 BenchContext，返回要计时的无参函数"""
+    def register(setup):
+        CASES.append({"name": name, "setup": setup, "repeat": repeat, "needs_tk": needs_tk})
+        return setup
+    return register
+
+class BenchContext:
+    """用例共享的对象（按需创建）"""
+    def __init__(self):
+        self._launcher = None
+        self._catalog = None
+        self._flushables = []
+        self._shutdowns = []
+
+    def track_shutdown(self, obj):
+        """登记需要在结束时关闭线程池的对象"""
+        self._shutdowns.append(obj)
+        return obj
+
+    def track(self, obj):
+        """登记需要在离开临时目录前落盘的对象（否则退出时会写到当前目录）"""
+        self._flushables.append(obj)
+        return obj
+
+    def config(self, **kwargs):
+        from launcher_core import GameConfig
+        return self.track(GameConfig(**kwargs))
+
+    def stats(self):
+        from launcher_core import GameStats
+        stats = GameStats(self.config())
+        self.track(stats.session_log)
+        return stats
+
+    def catalog(self, size=10000):
+        """填充了 size 个条目的游戏目录（多个用例共用）"""
+        if self._catalog is None:
+            from game_catalog import GameCatalog
+            languages = ("English", "Chinese", "Japanese", "Spanish")
+            events = ("", "halloween", "spring", "summer cup", "winter")
+            self._catalog = GameCatalog("bench_catalog.db")
+            self._catalog.add_many({
+                "path": f"games/{i}.html",
+                "title": f"Super Ball {events[i % 5]} {i}".replace("  ", " "),
+                "language": languages[i % 4],
+                "version": ("v1.0", "v2.0")[i % 2],
+                "event": events[i % 5],
+                "tags": ["event"] if events[i % 5] else ["classic"],
+            } for i in range(size))
+        return self._catalog
+    
+    def launcher(self):
+        if self._launcher is None:
+            from launcher_ui import GameLauncher
+            self._launcher = GameLauncher()
+            wait_for_startup(self._launcher)
+        return self._launcher
+
+    def close(self):
+        if self._launcher is not None:
+            self._launcher.animation_handler.cancel_all()
+            self._launcher.core.shutdown()
+            self._launcher.destroy()
+            self._launcher = None
+        if self._catalog is not None:
+            self._catalog.close()
+            self._catalog = None
+        for obj in self._flushables:
+            obj.flush()
+        self._flushables = []
+        for obj in self._shutdowns:
+            obj.shutdown()
+        self._shutdowns = []
+
+def wait_for_startup(app, timeout=30):
+    """处理 Tk 事件直到 GameLauncher 完成延迟的启动工作"""
+    deadline = time.monotonic() + timeout
+    while not app.startup_finished:
+        if time.monotonic() > deadline:
+            raise RuntimeError("GameLauncher.finish_startup 未在限定时间内完成")
+        app.update()
+
+@case("config.load_config")
+def bench_config_load(ctx):
+    config = ctx.config()
+    config.save_config()
+    return config.load_config
+
+@case("config.save_config")
+def bench_config_save(ctx):
+    config = ctx.config()
+    return config.save_config
+
+@case("config.set", repeat=2000)
+def bench_config_set(ctx):
+    config = ctx.config(flush_delay=3600)
+    counter = iter(range(10 ** 9))
+    return lambda: config.set("window_position", {"x": next(counter), "y": 0})
+
+@case("stats.record_session", repeat=1000)
+def bench_record_session(ctx):
+    stats = ctx.stats()
+    return lambda: stats.record_session("English", "v2.0", 25.0)
+
+@case("stats.get_stats", repeat=1000)
+def bench_get_stats(ctx):
+    stats = ctx.stats()
+    for _ in range(500):
+        stats.record_session("Chinese", "v1.0", 30.0)
+    return stats.get_stats
+
+@case("catalog.search", repeat=100)
+def bench_catalog_search(ctx):
+    catalog = ctx.catalog()
+    queries = iter(["super", "hall eng", "#event win", "jap v1"] * 10 ** 6)
+    return lambda: catalog.search(next(queries))
+
+@case("discovery.rescan", repeat=50)
+def bench_discovery_rescan(ctx):
+    from game_discovery import GameDiscovery
+    for i in range(2000):
+        folder = os.path.join("arcade", f"event{i // 100}", f"build{i // 10}")
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, f"game{i}.html"), 'w', encoding='utf-8') as f:
+            f.write('<html lang="en"><head><meta name="superball-game" content="lang=en"><title>Super Ball</title>')
+    discovery = GameDiscovery(["arcade"], snapshot_file="bench_snapshot.json")
+    ctx.track_shutdown(discovery)
+    discovery.scan()
+    # 计时的是没有变化时的增量扫描（监视器每次轮询的开销）
+    return discovery.scan
+
+@case("ui.update_stats_display", needs_tk=True)
+def bench_update_stats_display(ctx):
+    app = ctx.launcher()
+
+    def run():
+        app.update_stats_display()
+        app.update_idletasks()
+    return run
+
+@case("ui.refresh_ui", needs_tk=True)
+def bench_refresh_ui(ctx):
+    app = ctx.launcher()
+    themes = iter(["light", "dark"] * 10 ** 6)
+
+    def run():
+        app.game_config.set("theme", next(themes))
+        app.refresh_ui()
+        app.update_idletasks()
+    return run
+
+@case("ui.library_scroll", needs_tk=True)
+def bench_library_scroll(ctx):
+    app = ctx.launcher()
+    catalog = ctx.catalog()
+    app.library.fetch = lambda game_ids: {
+        game_id: entry["title"] for game_id, entry in catalog.get_many(game_ids).items()
+    }
+    app.library.set_keys(catalog.search())
+    app.update_idletasks()
+
+    def run():
+        app.library.yview("scroll", 1, "pages")
+        app.update_idletasks()
+    return run
+
+@case("ui.GameLauncher", repeat=20, needs_tk=True)
+def bench_construct_launcher(ctx):
+    from launcher_ui import GameLauncher
+
+    def run():
+        app = GameLauncher()
+        wait_for_startup(app)
+        app.core.shutdown()
+        app.destroy()
+    return run
+
+def percentile(sorted_values, q):
+    """最近秩百分位数"""
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+def measure(fn, repeat, warmup):
+    """预热后逐次计时，返回每次耗时（毫秒）"""
+    for _ in range(warmup):
+        fn()
+    timings = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings
+
+def summarize(timings):
+    ordered = sorted(timings)
+    return {
+        "repeat": len(ordered),
+        "median_ms": percentile(ordered, 0.50),
+        "p95_ms": percentile(ordered, 0.95),
+        "mean_ms": sum(ordered) / len(ordered),
+        "min_ms": ordered[0],
+    }
+
+def start_virtual_display():
+    """没有图形显示时尝试启动 Xvfb，返回 Xvfb 进程（未启动时为 None）"""
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        return None
+    for display in range(99, 120):
+        socket_path = f"/tmp/.X11-unix/X{display}"
+        if os.path.exists(socket_path):
+            continue
+        process = subprocess.Popen(
+            [xvfb, f":{display}", "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 3
+        while time.monotonic() < deadline and process.poll() is None:
+            if os.path.exists(socket_path):
+                os.environ["DISPLAY"] = f":{display}"
+                return process
+            time.sleep(0.05)
+        process.terminate()
+    return None
+
+def tk_available():
+    """能否创建 Tk 窗口"""
+    try:
+        import tkinter
+        root = tkinter.Tk()
+        root.destroy()
+        return True
+    except Exception:
+        return False
+
+def run_cases(names=None, warmup=5, scale=1.0, progress=print):
+    """运行基准用例，返回 (结果, 跳过的用例及原因)"""
+    selected = [c for c in CASES if not names or c["name"] in names]
+    xvfb = None
+    has_tk = False
+    if any(c["needs_tk"] for c in selected):
+        xvfb = start_virtual_display()
+        has_tk = tk_available()
+
+    results = {}
+    skipped = {}
+    original_cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix="superball-bench-")
+    ctx = BenchContext()
+    try:
+        os.chdir(workdir)
+        # 界面用例需要模板和字符串表；编译产物不复制，第一次启动时重新编译
+        shutil.copytree(os.path.join(REPO_DIR, GAME_DIR), GAME_DIR,
+                        ignore=shutil.ignore_patterns("super_ball-*.html", ".build_index.json"))
+        for bench in selected:
+            if bench["needs_tk"] and not has_tk:
+                skipped[bench["name"]] = "no display (install Xvfb or set DISPLAY)"
+                continue
+            fn = bench["setup"](ctx)
+            repeat = max(1, int(bench["repeat"] * scale))
+            results[bench["name"]] = summarize(measure(fn, repeat, warmup))
+            progress(f"  {bench['name']:<28} median {results[bench['name']]['median_ms']:.3f} ms")
+    finally:
+        ctx.close()
+        os.chdir(original_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+    return results, skipped
+
+def compare(results, baseline, threshold, noise_ms=0.05):
+    """与基线比较中位数，返回变慢的用例 {名称: (基线, 当前)}"""
+    regressions = {}
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        before, after = base["median_ms"], result["median_ms"]
+        if after > before * (1 + threshold) and after - before > noise_ms:
+            regressions[name] = (before, after)
+    return regressions
+
+def format_table(results, skipped, baseline=None):
+    """把结果格式化为文本表格"""
+    lines = [f"{'case':<28} {'median':>10} {'p95':>10} {'mean':>10} {'baseline':>10} {'change':>8}"]
+    base_results = (baseline or {}).get("results", {})
+    for name, r in results.items():
+        base = base_results.get(name)
+        if base:
+            change = f"{r['median_ms'] / base['median_ms'] - 1:+8.1%}" if base["median_ms"] else f"{'':>8}"
+            base_text = f"{base['median_ms']:10.3f}"
+        else:
+            change, base_text = f"{'':>8}", f"{'-':>10}"
+        lines.append(
+            f"{name:<28} {r['median_ms']:10.3f} {r['p95_ms']:10.3f} {r['mean_ms']:10.3f} {base_text} {change}"
+        )
+    for name, reason in skipped.items():
+        lines.append(f"{name:<28} skipped: {reason}")
+    lines.append("(times in ms)")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Super Ball launcher hot paths")
+    parser.add_argument("--case", action="append", help="只运行指定用例，可重复: " + ", ".join(c["name"] for c in CASES))
+    parser.add_argument("--warmup", type=int, default=5, help="每个用例的预热次数")
+    parser.add_argument("--scale", type=float, default=1.0, help="重复次数的倍数")
+    parser.add_argument("--baseline", help="与基线JSON比较")
+    parser.add_argument("--threshold", type=float, default=0.25, help="中位数变慢超过该比例视为回归")
+    parser.add_argument("--save-baseline", metavar="PATH", help="把本次结果写入基线JSON")
+    parser.add_argument("--json", action="store_true", help="以JSON输出")
+    args = parser.parse_args(argv)
+
+    # 用例在临时目录中运行，先把仓库目录加入模块搜索路径
+    sys.path.insert(0, REPO_DIR)
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"读取基线失败: {e}")
+            return 2
+
+    results, skipped = run_cases(args.case, args.warmup, args.scale,
+                                 progress=(lambda message: None) if args.json else print)
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+        "skipped": skipped,
+    }
+    regressions = compare(results, baseline, args.threshold) if baseline else {}
+
+    if args.json:
+        print(json.dumps(dict(report, regressions=regressions), indent=4, ensure_ascii=False))
+    else:
+        print(format_table(results, skipped, baseline))
+        for name, (before, after) in regressions.items():
+            print(f"REGRESSION {name}: {before:.3f} ms -> {after:.3f} ms")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4, ensure_ascii=False)
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""Super Ball 浏览器启动
+
+第一次启动时查找浏览器可执行文件，结果缓存在配置中，之后不再逐个探测。浏览器通过
+subprocess 以应用窗口（--app）或全屏（--kiosk）模式启动，每个游戏使用自己的配置
+目录（按地址中不含主机和端口的路径区分，跨会话保持不变），这样得到的子进程就是这个
+游戏窗口的浏览器本身。同一个游戏的浏览器仍在运行时不再新开窗口，而是尽量把它切到
+前台。长期未使用的配置目录会被清理。找不到可用浏览器时退回 webbrowser.open。
+"""
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+import urllib.parse
+
+# 浏览器模式：app - 独立应用窗口，kiosk - 全屏，tab - 交给系统默认浏览器新开标签页
+BROWSER_MODES = ("app", "kiosk", "tab")
+
+def _candidates():
+    """当前平台上按优先顺序排列的 (类型, 可执行文件) 候选"""
+    if sys.platform == "win32":
+        roots = [os.environ.get(name) for name in ("PROGRAMFILES", "PROGRAMFILES(X86)", "LOCALAPPDATA")]
+        relative = [
+            ("chromium", r"Google\Chrome\Application\chrome.exe"),
+            ("chromium", r"Microsoft\Edge\Application\msedge.exe"),
+            ("chromium", r"BraveSoftware\Brave-Browser\Application\brave.exe"),
+            ("firefox", r"Mozilla Firefox\firefox.exe"),
+        ]
+        return [(kind, os.path.join(root, path)) for kind, path in relative for root in roots if root]
+    if sys.platform == "darwin":
+        return [
+            ("chromium", "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"),
+            ("chromium", "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"),
+            ("chromium", "/Applications/Chromium.app/Contents/MacOS/Chromium"),
+            ("chromium", "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser"),
+            ("firefox", "/Applications/Firefox.app/Contents/MacOS/firefox"),
+        ]
+    names = [
+        ("chromium", "google-chrome"), ("chromium", "google-chrome-stable"),
+        ("chromium", "chromium"), ("chromium", "chromium-browser"),
+        ("chromium", "microsoft-edge"), ("chromium", "brave-browser"),
+        ("firefox", "firefox"),
+    ]
+    return [(kind, shutil.which(name)) for kind, name in names]
+
+def _focus_windows(pid):
+    """Windows：把进程的可见顶层窗口切到前台（最小化时先还原）"""
+    import ctypes
+    from ctypes import wintypes
+    user32 = ctypes.windll.user32
+    found = []
+
+    @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    def visit(hwnd, _):
+        owner = wintypes.DWORD()
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner))
+        # GW_OWNER = 4：只要没有所有者的顶层窗口，跳过对话框和弹出窗口
+        if owner.value == pid and user32.IsWindowVisible(hwnd) and not user32.GetWindow(hwnd, 4):
+            found.append(hwnd)
+            return False
+        return True
+
+    user32.EnumWindows(visit, 0)
+    if not found:
+        return False
+    if user32.IsIconic(found[0]):
+        user32.ShowWindow(found[0], 9)  # SW_RESTORE
+    return bool(user32.SetForegroundWindow(found[0]))
+
+def _kind_of(path):
+    return "firefox" if "firefox" in os.path.basename(path).lower() else "chromium"
+
+class BrowserLauncher:
+    """浏览器解析缓存与游戏窗口进程管理"""
+    # 超过该天数未使用的配置目录在启动时删除
+    PROFILE_MAX_AGE_DAYS = 30
+
+    def __init__(self, game_config, profile_dir=".browser_profile"):
+        self.game_config = game_config
+        self.profile_dir = os.path.abspath(profile_dir)
+        self._browser = None
+        self._resolved = False
+        # 游戏标识（见 game_key）-> 仍在运行的浏览器子进程
+        self.processes = {}
+        # 每次启动的记录: url, method (spawn/reuse/webbrowser), pid, focused, elapsed_ms
+        self.launches = []
+        self.prune_profiles()
+
+    def resolve(self):
+        """返回 {"kind", "path"}，找不到时返回 None（每个会话最多探测一次）"""
+        if self._resolved:
+            return self._browser
+        self._resolved = True
+
+        override = self.game_config.get("browser_path", "")
+        if override:
+            if os.path.isfile(override):
+                self._browser = {"kind": _kind_of(override), "path": override}
+                return self._browser
+            print(f"配置的浏览器不存在: {override}")
+
+        cached = self.game_config.get("browser_cache") or {}
+        if cached.get("path") and os.path.isfile(cached["path"]):
+            self._browser = cached
+            return self._browser
+
+        for kind, path in _candidates():
+            if path and os.path.isfile(path):
+                self._browser = {"kind": kind, "path": path}
+                break
+        self.game_config.set("browser_cache", self._browser or {})
+        return self._browser
+
+    def forget(self):
+        """丢弃缓存的浏览器（可执行文件失效时），下次重新探测"""
+        self._browser = None
+        self._resolved = False
+        self.game_config.set("browser_cache", {})
+
+    @staticmethod
+    def game_key(url):
+        """游戏的稳定标识：地址去掉协议、主机和端口后的路径
+
+        本地服务器每个会话的端口都不同，路径（目录编号 + 文件名）保持不变。
+        """
+        return urllib.parse.urlsplit(url).path
+
+    def profile_for(self, url):
+        """游戏专用的浏览器配置目录（同一配置只能属于一个浏览器进程）"""
+        digest = hashlib.sha1(self.game_key(url).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.profile_dir, digest)
+
+    def prune_profiles(self, max_age_days=None):
+        """删除长期未使用的配置目录，返回删除的数量"""
+        if max_age_days is None:
+            max_age_days = self.PROFILE_MAX_AGE_DAYS
+        cutoff = time.time() - max_age_days * 86400
+        in_use = {self.profile_for(url) for url in self.processes}
+        removed = 0
+        try:
+            entries = list(os.scandir(self.profile_dir))
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                if not entry.is_dir() or entry.path in in_use or entry.stat().st_mtime >= cutoff:
+                    continue
+                shutil.rmtree(entry.path)
+                removed += 1
+            except OSError as e:
+                print(f"清理浏览器配置失败: {e}")
+        return removed
+
+    def touch_profile(self, url):
+        """更新配置目录的修改时间，标记为最近使用"""
+        try:
+            os.utime(self.profile_for(url))
+        except OSError:
+            pass
+
+    def command(self, browser, url, mode):
+        """构造启动命令行"""
+        profile = self.profile_for(url)
+        if browser["kind"] == "firefox":
+            os.makedirs(profile, exist_ok=True)
+            # 不加 -no-remote：该配置已在运行时把地址交给那个实例，而不是报错退出
+            args = [browser["path"], "-profile", profile]
+            if mode == "kiosk":
+                args.append("--kiosk")
+            return args + ["--new-window", url]
+        args = [
+            browser["path"],
+            f"--user-data-dir={profile}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ]
+        if mode == "kiosk":
+            return args + ["--kiosk", url]
+        return args + [f"--app={url}"]
+
+    def reap(self):
+        """清理已经退出的子进程"""
+        for key, process in list(self.processes.items()):
+            if process.poll() is not None:
+                del self.processes[key]
+
+    def running(self):
+        """仍在运行的游戏窗口 {游戏标识: pid}"""
+        self.reap()
+        return {url: process.pid for url, process in self.processes.items()}
+
+    def _spawn(self, browser, url, mode):
+        kwargs = {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.DEVNULL,
+        }
+        # 与启动器脱离，关闭启动器或终端不会带走游戏窗口
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+        return subprocess.Popen(self.command(browser, url, mode), **kwargs)
+
+    def focus(self, pid):
+        """尽量把进程的窗口切到前台，返回是否成功"""
+        if sys.platform == "win32":
+            try:
+                return _focus_windows(pid)
+            except (OSError, AttributeError, ValueError):
+                return False
+        if sys.platform == "darwin":
+            script = f'tell application "System Events" to set frontmost of (first process whose unix id is {pid}) to true'
+            args = ["osascript", "-e", script]
+        elif shutil.which("xdotool"):
+            args = ["xdotool", "search", "--onlyvisible", "--pid", str(pid), "windowactivate"]
+        else:
+            return False
+        try:
+            return subprocess.run(
+                args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2
+            ).returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+    def open(self, url):
+        """打开游戏：该游戏的浏览器仍在运行时复用（尽量切到前台），否则启动浏览器，返回本次启动记录"""
+        start = time.perf_counter()
+        mode = self.game_config.get("browser_mode", "app")
+        self.reap()
+        key = self.game_key(url)
+        process = self.processes.get(key)
+        method = None
+        focused = False
+
+        if process is not None:
+            # 不重新启动：同配置的浏览器会把地址交给已有实例，多开一个游戏窗口
+            method = "reuse"
+            focused = self.focus(process.pid)
+            if not focused:
+                print(f"游戏窗口仍在运行（pid {process.pid}），无法切到前台，保留现有窗口")
+            self.touch_profile(url)
+        elif mode != "tab":
+            browser = self.resolve()
+            if browser is not None:
+                try:
+                    process = self._spawn(browser, url, mode)
+                    self.processes[key] = process
+                    self.touch_profile(url)
+                    method = "spawn"
+                except OSError as e:
+                    print(f"启动浏览器失败: {e}")
+                    self.forget()
+
+        if method is None:
+            import webbrowser
+            webbrowser.open(url)
+            method = "webbrowser"
+            process = None
+
+        launch = {
+            "url": url,
+            "method": method,
+            "pid": process.pid if process is not None else None,
+            "focused": focused,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+        self.launches.append(launch)
+        return launch
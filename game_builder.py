@@ -0,0 +1,165 @@
+"""Super Ball 游戏页面构建
+
+各语言版本由同一个模板 super_ball.template.html 和字符串表 strings.json
+编译生成。新增语言只需在字符串表里增加一项。编译结果按模板和字符串表的哈希
+缓存，内容未变化时不会重写文件。
+
+模板占位符:
+    {{name}}       - 字符串表中的值，HTML 转义
+    {{name|json}}  - JSON 编码，用于 <script> 内
+    {{name|raw}}   - 原样插入
+可用的名称为该语言 strings 中的键，以及 lang 和 strings（整个字符串表）。
+"""
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+
+# 构建逻辑变化时递增，使旧的缓存失效
+BUILDER_VERSION = 1
+
+PLACEHOLDER = re.compile(r"\{\{\s*(\w+)(?:\|(\w+))?\s*\}\}")
+
+class BuildError(Exception):
+    """模板或字符串表有误"""
+
+class GameBuilder:
+    """游戏页面编译器"""
+    def __init__(self, source_dir="super_ball-HTMLfile", template="super_ball.template.html",
+                 table="strings.json", output_dir=None):
+        self.source_dir = source_dir
+        self.template_path = os.path.join(source_dir, template)
+        self.table_path = os.path.join(source_dir, table)
+        self.output_dir = output_dir or source_dir
+        self.index_path = os.path.join(self.output_dir, ".build_index.json")
+        self._table = None
+        self._table_signature = None
+
+    def load_table(self):
+        """加载字符串表（文件未变化时复用）"""
+        st = os.stat(self.table_path)
+        signature = (st.st_size, st.st_mtime_ns)
+        if self._table is None or signature != self._table_signature:
+            with open(self.table_path, 'r', encoding='utf-8') as f:
+                self._table = json.load(f)
+            self._table_signature = signature
+        return self._table
+
+    def languages(self):
+        """字符串表中的所有语言"""
+        return list(self.load_table())
+
+    def _entry(self, language):
+        table = self.load_table()
+        for name, entry in table.items():
+            if name.lower() == language.lower():
+                return name, entry
+        raise BuildError(f"字符串表中没有语言: {language}")
+
+    def output_path(self, language):
+        """语言版本的编译产物路径"""
+        name, entry = self._entry(language)
+        return os.path.join(self.output_dir, entry.get("output", f"super_ball-{name.lower()}.html"))
+
+    def render(self, template, entry):
+        """用一种语言的字符串表填充模板"""
+        context = dict(entry["strings"], lang=entry.get("lang", ""), strings=entry["strings"])
+
+        def substitute(match):
+            name, fmt = match.group(1), match.group(2) or "html"
+            if name not in context:
+                raise BuildError(f"字符串表缺少键: {name}")
+            value = context[name]
+            if fmt == "json":
+                return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
+            if fmt == "raw":
+                return str(value)
+            if fmt == "html":
+                return html.escape(str(value), quote=True)
+            raise BuildError(f"未知的占位符格式: {fmt}")
+
+        return PLACEHOLDER.sub(substitute, template)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def build(self, languages=None, force=False):
+        """编译指定语言（默认全部），返回 ({语言: 路径}, [重新生成的路径])"""
+        with open(self.template_path, 'rb') as f:
+            template_bytes = f.read()
+        template_hash = hashlib.sha256(template_bytes).hexdigest()
+        template = None
+        index = self._load_index()
+        paths = {}
+        rebuilt = []
+
+        for language in languages or self.languages():
+            name, entry = self._entry(language)
+            output = self.output_path(name)
+            entry_blob = json.dumps(entry, sort_keys=True, ensure_ascii=False)
+            key = hashlib.sha256(
+                f"{BUILDER_VERSION}:{template_hash}:{entry_blob}".encode('utf-8')
+            ).hexdigest()
+            paths[name] = output
+
+            cached = index.get(name, {})
+            try:
+                st = os.stat(output)
+                fresh = (
+                    not force
+                    and cached.get("key") == key
+                    and cached.get("signature") == [st.st_size, st.st_mtime_ns]
+                )
+            except OSError:
+                fresh = False
+            if fresh:
+                continue
+
+            if template is None:
+                template = template_bytes.decode('utf-8')
+            content = self.render(template, entry).encode('utf-8')
+            os.makedirs(self.output_dir, exist_ok=True)
+            tmp_path = output + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, output)
+            st = os.stat(output)
+            index[name] = {"key": key, "signature": [st.st_size, st.st_mtime_ns]}
+            rebuilt.append(output)
+
+        if rebuilt:
+            self._save_index(index)
+        return paths, rebuilt
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Compile Super Ball language variants from the template")
+    parser.add_argument("--language", action="append", help="只编译指定语言，可重复")
+    parser.add_argument("--force", action="store_true", help="忽略缓存强制重新编译")
+    parser.add_argument("--source-dir", default="super_ball-HTMLfile")
+    args = parser.parse_args(argv)
+
+    builder = GameBuilder(args.source_dir)
+    try:
+        paths, rebuilt = builder.build(args.language, args.force)
+    except (OSError, ValueError, BuildError) as e:
+        print(f"编译失败: {e}")
+        return 1
+    for name, path in paths.items():
+        print(f"{name}: {path} ({'built' if path in rebuilt else 'up to date'})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""Super Ball 游戏目录
+
+用 SQLite 保存所有可启动的游戏页面：标题、语言、版本、活动、标签和游玩次数。
+标题等字段拆成词后存入带索引的词表，按词前缀搜索只做索引范围扫描；标签用
+"#标签" 精确匹配。搜索只返回 id 列表，界面按需读取可见行的详细信息，所以几万条
+目录也能即时搜索和滚动。
+
+每个条目属于一个来源（例如 builtin 表示模板编译的内置页面），sync 用新的条目集合
+替换一个来源的全部条目，仍然存在的条目保留游玩次数。
+
+示例:
+    python game_catalog.py search "super eng #builtin"
+    python game_catalog.py add games/halloween.html --language English --version v2.0 --tag event
+    python game_catalog.py remove games/halloween.html
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime
+
+# 数据库结构变化时递增，旧库会被重建
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    version TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL,
+    sort_key TEXT NOT NULL,
+    language TEXT NOT NULL DEFAULT '',
+    event TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    play_count INTEGER NOT NULL DEFAULT 0,
+    last_played TEXT NOT NULL DEFAULT '',
+    added TEXT NOT NULL,
+    UNIQUE (path, version)
+);
+CREATE INDEX IF NOT EXISTS games_sort ON games (sort_key, language, version);
+CREATE INDEX IF NOT EXISTS games_source ON games (source);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL,
+    game_id INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, game_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tags_game ON tags (game_id);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT NOT NULL,
+    game_id INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+    PRIMARY KEY (term, game_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS terms_game ON terms (game_id);
+"""
+
+COLUMNS = ("id", "path", "version", "title", "language", "event", "source", "play_count", "last_played", "added")
+
+WORD = re.compile(r"[\w.]+")
+
+def tokenize(*texts):
+    """把文字拆成小写的搜索词"""
+    words = set()
+    for text in texts:
+        words.update(WORD.findall(str(text).casefold()))
+    return words
+
+def parse_query(text):
+    """把搜索框内容拆成 (词前缀列表, 标签列表)，"#xxx" 为标签"""
+    prefixes, tags = [], []
+    for token in text.split():
+        if token.startswith("#"):
+            if len(token) > 1:
+                tags.append(token[1:].casefold())
+        else:
+            prefixes.extend(sorted(tokenize(token)))
+    return prefixes, tags
+
+def prefix_bound(prefix):
+    """前缀范围的上界：以 prefix 开头的字符串都小于它"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+class GameCatalog:
+    """游戏目录（SQLite）"""
+    def __init__(self, db_path="game_catalog.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self._create_schema()
+
+    def _create_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            # 目录可以从游戏文件重新生成，结构不兼容时直接重建
+            with self.conn:
+                for table in ("terms", "tags", "games"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+
+    def _upsert(self, path, title=None, language="", version="", event="", tags=(), source=""):
+        path = self._key(path)
+        title = title or os.path.splitext(os.path.basename(path))[0]
+        tags = sorted({tag.casefold() for tag in tags if tag})
+        self.conn.execute(
+            """INSERT INTO games (path, version, title, sort_key, language, event, source, added)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (path, version) DO UPDATE SET
+                   title = excluded.title, sort_key = excluded.sort_key, language = excluded.language,
+                   event = excluded.event, source = excluded.source""",
+            (path, version, title, title.casefold(), language, event, source,
+             datetime.now().isoformat(timespec="seconds")),
+        )
+        game_id = self.conn.execute(
+            "SELECT id FROM games WHERE path = ? AND version = ?", (path, version)
+        ).fetchone()[0]
+        self.conn.execute("DELETE FROM tags WHERE game_id = ?", (game_id,))
+        self.conn.executemany("INSERT INTO tags (tag, game_id) VALUES (?, ?)", [(tag, game_id) for tag in tags])
+        self.conn.execute("DELETE FROM terms WHERE game_id = ?", (game_id,))
+        self.conn.executemany(
+            "INSERT INTO terms (term, game_id) VALUES (?, ?)",
+            [(term, game_id) for term in tokenize(title, language, version, event, *tags)],
+        )
+        return game_id
+
+    def add(self, path, **fields):
+        """添加或更新一个条目，返回 id"""
+        with self.conn:
+            return self._upsert(path, **fields)
+
+    def add_many(self, entries):
+        """在一个事务中添加多个条目（每项为 add 的关键字参数，含 path），返回 id 列表"""
+        with self.conn:
+            return [self._upsert(**entry) for entry in entries]
+
+    def sync(self, source, entries):
+        """用 entries 替换来源 source 的全部条目，返回 (新增或更新数, 删除数)"""
+        with self.conn:
+            ids = [self._upsert(**dict(entry, source=source)) for entry in entries]
+            keep = ",".join(str(game_id) for game_id in ids) or "NULL"
+            removed = self.conn.execute(
+                f"DELETE FROM games WHERE source = ? AND id NOT IN ({keep})", (source,)
+            ).rowcount
+        return len(ids), removed
+
+    def remove(self, path, version=None):
+        """删除路径对应的条目（不指定版本时删除所有版本），返回删除数"""
+        with self.conn:
+            if version is None:
+                cursor = self.conn.execute("DELETE FROM games WHERE path = ?", (self._key(path),))
+            else:
+                cursor = self.conn.execute(
+                    "DELETE FROM games WHERE path = ? AND version = ?", (self._key(path), version)
+                )
+        return cursor.rowcount
+
+    def record_play(self, path, version):
+        """记录一次游玩，条目不存在时忽略"""
+        with self.conn:
+            self.conn.execute(
+                """UPDATE games SET play_count = play_count + 1, last_played = ?
+                   WHERE path = ? AND version = ?""",
+                (datetime.now().isoformat(timespec="seconds"), self._key(path), version),
+            )
+
+    def search(self, text="", language=None, version=None):
+        """按搜索框内容（词前缀和 #标签）查找，返回按标题排序的 id 列表"""
+        prefixes, tags = parse_query(text)
+        clauses, params = [], []
+        for prefix in prefixes:
+            clauses.append("id IN (SELECT game_id FROM terms WHERE term >= ? AND term < ?)")
+            params += [prefix, prefix_bound(prefix)]
+        for tag in tags:
+            clauses.append("id IN (SELECT game_id FROM tags WHERE tag = ?)")
+            params.append(tag)
+        if language is not None:
+            clauses.append("language = ?")
+            params.append(language)
+        if version is not None:
+            clauses.append("version = ?")
+            params.append(version)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT id FROM games{where} ORDER BY sort_key, language, version", params
+        )
+        return [row[0] for row in rows]
+
+    def get_many(self, ids):
+        """读取若干条目，返回 {id: 条目字典}（含标签列表）"""
+        ids = list(ids)
+        entries = {}
+        # 分批查询，避免超出 SQLite 的参数个数上限
+        for start in range(0, len(ids), 500):
+            batch = ids[start:start + 500]
+            marks = ",".join("?" * len(batch))
+            for row in self.conn.execute(f"SELECT {', '.join(COLUMNS)} FROM games WHERE id IN ({marks})", batch):
+                entries[row["id"]] = dict(zip(COLUMNS, row), tags=[])
+            for game_id, tag in self.conn.execute(
+                f"SELECT game_id, tag FROM tags WHERE game_id IN ({marks}) ORDER BY tag", batch
+            ):
+                entries[game_id]["tags"].append(tag)
+        return entries
+
+    def get(self, game_id):
+        return self.get_many([game_id]).get(game_id)
+
+    def find(self, path, version):
+        """按路径和版本查找条目 id"""
+        row = self.conn.execute(
+            "SELECT id FROM games WHERE path = ? AND version = ?", (self._key(path), version)
+        ).fetchone()
+        return row[0] if row else None
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the Super Ball game catalog")
+    parser.add_argument("--db", default="game_catalog.db", help="目录数据库路径")
+    commands = parser.add_subparsers(dest="command", required=True)
+    search = commands.add_parser("search", help="按词前缀和 #标签 搜索")
+    search.add_argument("query", nargs="?", default="", help='例如 "super eng #event"')
+    search.add_argument("--language")
+    search.add_argument("--version")
+    search.add_argument("--json", action="store_true", help="以JSON输出")
+    add = commands.add_parser("add", help="添加或更新游戏页面")
+    add.add_argument("path")
+    add.add_argument("--title")
+    add.add_argument("--language", default="")
+    add.add_argument("--version", default="")
+    add.add_argument("--event", default="")
+    add.add_argument("--tag", action="append", default=[], help="标签，可重复")
+    remove = commands.add_parser("remove", help="删除游戏页面")
+    remove.add_argument("path")
+    remove.add_argument("--version")
+    args = parser.parse_args(argv)
+
+    try:
+        catalog = GameCatalog(args.db)
+    except sqlite3.Error as e:
+        print(f"打开游戏目录失败: {e}")
+        return 1
+    try:
+        if args.command == "add":
+            catalog.add(args.path, title=args.title, language=args.language, version=args.version,
+                        event=args.event, tags=args.tag, source="manual")
+            print(f"Added {os.path.abspath(args.path)}")
+            return 0
+        if args.command == "remove":
+            removed = catalog.remove(args.path, args.version)
+            print(f"Removed {removed} entries")
+            return 0 if removed else 1
+        ids = catalog.search(args.query, args.language, args.version)
+        entries = catalog.get_many(ids)
+        results = [entries[game_id] for game_id in ids]
+        if args.json:
+            print(json.dumps(results, indent=4, ensure_ascii=False))
+        else:
+            for entry in results:
+                tags = " ".join(f"#{tag}" for tag in entry["tags"])
+                print(f"{entry['title']:<28} {entry['language']:<10} {entry['version']:<6} "
+                      f"{entry['play_count']:>5} plays  {tags}")
+            print(f"{len(results)} games")
+        return 0
+    finally:
+        catalog.close()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""Super Ball 游戏文件夹发现
+
+在线程池中用 os.scandir 递归扫描游戏根目录，按文件头部的特征识别 Super Ball
+游戏页面（编译页面中的 <meta name="superball-game">，或旧版页面的标题加
+<canvas>）。每个目录的修改时间、子目录和文件的 (大小, 修改时间) 保存在快照
+文件中：之后的扫描只重新列出修改时间变化了的目录，未变化的目录只检查已知 HTML
+文件的大小和修改时间，因此可以低开销地定时轮询。
+
+示例:
+    python game_discovery.py games/ arcade/
+    python game_discovery.py games/ --json
+"""
+import argparse
+import json
+import os
+import queue
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# 快照格式变化时递增，旧快照会被丢弃（下次扫描重新列出全部目录）
+SNAPSHOT_VERSION = 1
+
+GAME_EXTENSIONS = (".html", ".htm")
+# 不进入的目录
+SKIP_DIRS = {"__pycache__", "node_modules"}
+# 识别特征只在文件开头查找
+HEAD_SIZE = 1 << 16
+
+META = re.compile(rb'<meta\s+name="superball-game"\s+content="([^"]*)"', re.IGNORECASE)
+TITLE = re.compile(rb"<title>([^<]*)</title>", re.IGNORECASE)
+HTML_LANG = re.compile(rb'<html[^>]*\blang="([^"]*)"', re.IGNORECASE)
+VERSION = re.compile(r"v\d+\.\d+")
+
+def sniff(path):
+    """读取文件头部判断是否为游戏页面，是则返回元数据 {"title", "lang", "version", "event"}，否则返回 None"""
+    with open(path, 'rb') as f:
+        head = f.read(HEAD_SIZE)
+    title = TITLE.search(head)
+    title = title.group(1).decode('utf-8', 'replace').strip() if title else ""
+    meta = META.search(head)
+    if meta and b"{{" in meta.group(1):
+        return None  # 未编译的模板
+    if meta:
+        fields = dict(
+            part.split("=", 1) for part in meta.group(1).decode('utf-8', 'replace').split(";") if "=" in part
+        )
+        fields = {key.strip(): value.strip() for key, value in fields.items()}
+    elif "super ball" in title.lower() and b"<canvas" in head:
+        fields = {}
+    else:
+        return None
+    lang = fields.get("lang")
+    if not lang:
+        match = HTML_LANG.search(head)
+        lang = match.group(1).decode('utf-8', 'replace') if match else ""
+    version = fields.get("version")
+    if not version:
+        match = VERSION.search(os.path.basename(path))
+        version = match.group(0) if match else ""
+    return {"title": title or "Super Ball", "lang": lang, "version": version, "event": fields.get("event", "")}
+
+class GameDiscovery:
+    """游戏根目录的增量扫描与快照"""
+    def __init__(self, roots=(), snapshot_file="discovery_snapshot.json", max_workers=4):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.snapshot_file = snapshot_file
+        self.max_workers = max_workers
+        # 目录绝对路径 -> {"mtime_ns", "dirs": [子目录名], "files": {文件名: [大小, 修改时间, 元数据或 None]}}
+        self.dirs = self.load_snapshot()
+        self._executor = None
+        self._lock = threading.Lock()
+        self._scanning = False
+        self._results = queue.Queue()
+
+    def load_snapshot(self):
+        """加载快照文件"""
+        try:
+            if os.path.exists(self.snapshot_file):
+                with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+                if snapshot.get("version") == SNAPSHOT_VERSION:
+                    return snapshot["dirs"]
+        except Exception as e:
+            print(f"加载扫描快照失败: {e}")
+        return {}
+
+    def save_snapshot(self):
+        """保存快照文件"""
+        from launcher_core import atomic_write_json
+        try:
+            atomic_write_json(self.snapshot_file, {"version": SNAPSHOT_VERSION, "dirs": self.dirs})
+        except Exception as e:
+            print(f"保存扫描快照失败: {e}")
+
+    def set_roots(self, roots):
+        """更换根目录（快照中其它根目录的记录在下次扫描时丢弃）"""
+        self.roots = [os.path.abspath(root) for root in roots]
+
+    def games(self):
+        """快照中的所有游戏页面 {路径: 元数据}"""
+        found = {}
+        for directory, record in self.dirs.items():
+            for name, (_, _, meta) in record["files"].items():
+                if meta is not None:
+                    found[os.path.join(directory, name)] = meta
+        return found
+
+    def _visit(self, directory, old):
+        """扫描一个目录，返回 (目录记录, 子目录路径列表)；目录不存在时记录为 None"""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None, []
+        if old is not None and old["mtime_ns"] == mtime_ns:
+            # 目录项没有变化：只检查已知 HTML 文件的大小和修改时间（包括上次未识别为游戏的，
+            # 它们可能当时还是空文件或没复制完，之后又被原地修改）
+            files = dict(old["files"])
+            for name, (size, file_mtime, meta) in old["files"].items():
+                try:
+                    st = os.stat(os.path.join(directory, name))
+                except OSError:
+                    del files[name]
+                    continue
+                if (st.st_size, st.st_mtime_ns) != (size, file_mtime):
+                    files[name] = self._file_record(os.path.join(directory, name), st)
+            record = {"mtime_ns": mtime_ns, "dirs": old["dirs"], "files": files}
+            return record, [os.path.join(directory, name) for name in old["dirs"]]
+
+        old_files = old["files"] if old is not None else {}
+        subdirs, files = [], {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                                subdirs.append(entry.name)
+                        elif entry.name.lower().endswith(GAME_EXTENSIONS) and entry.is_file():
+                            st = entry.stat()
+                            previous = old_files.get(entry.name)
+                            if previous is not None and previous[:2] == [st.st_size, st.st_mtime_ns]:
+                                files[entry.name] = previous
+                            else:
+                                files[entry.name] = self._file_record(entry.path, st)
+                    except OSError:
+                        continue
+        except OSError:
+            return None, []
+        subdirs.sort()
+        record = {"mtime_ns": mtime_ns, "dirs": subdirs, "files": files}
+        return record, [os.path.join(directory, name) for name in subdirs]
+
+    @staticmethod
+    def _file_record(path, st):
+        try:
+            meta = sniff(path)
+        except OSError:
+            meta = None
+        return [st.st_size, st.st_mtime_ns, meta]
+
+    def scan(self):
+        """扫描所有根目录并更新快照，返回 {"added", "removed", "changed", "dirs", "listed", "elapsed_ms"}
+
+        added/removed/changed 为游戏页面路径列表，listed 为重新列出内容的目录数。
+        """
+        start = time.perf_counter()
+        before = self.games()
+        old_dirs = self.dirs
+        new_dirs = {}
+        listed = 0
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="discovery")
+        queued = set(self.roots)
+        pending = {
+            self._executor.submit(self._visit, root, old_dirs.get(root)): root for root in queued
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                record, subdirs = future.result()
+                if record is None:
+                    continue
+                old = old_dirs.get(directory)
+                if old is None or old["mtime_ns"] != record["mtime_ns"]:
+                    listed += 1
+                new_dirs[directory] = record
+                for subdir in subdirs:
+                    if subdir not in queued:
+                        queued.add(subdir)
+                        pending[self._executor.submit(self._visit, subdir, old_dirs.get(subdir))] = subdir
+
+        self.dirs = new_dirs
+        after = self.games()
+        changed = [
+            path for path in after
+            if path in before and self._signature(old_dirs, path) != self._signature(new_dirs, path)
+        ]
+        result = {
+            "added": sorted(set(after) - set(before)),
+            "removed": sorted(set(before) - set(after)),
+            "changed": sorted(changed),
+            "dirs": len(new_dirs),
+            "listed": listed,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+        if new_dirs != old_dirs:
+            self.save_snapshot()
+        return result
+
+    @staticmethod
+    def _signature(dirs, path):
+        directory, name = os.path.split(path)
+        return dirs[directory]["files"][name][:2]
+
+    def scan_async(self, callback=None):
+        """在后台线程中扫描；结果需在Tk线程调用 deliver() 取回。已有扫描进行中时返回 False"""
+        with self._lock:
+            if self._scanning:
+                return False
+            self._scanning = True
+
+        def run():
+            try:
+                result = self.scan()
+            except Exception as e:
+                print(f"扫描游戏目录失败: {e}")
+                result = None
+            # 先放入结果再清除标志，轮询方看到扫描结束时结果一定已经可取
+            self._results.put((result, callback))
+            with self._lock:
+                self._scanning = False
+
+        threading.Thread(target=run, name="discovery-scan", daemon=True).start()
+        return True
+
+    @property
+    def scanning(self):
+        with self._lock:
+            return self._scanning
+
+    def deliver(self):
+        """在Tk线程中取回已完成的扫描并执行回调，返回是否有扫描结束（包括失败的）"""
+        delivered = False
+        while True:
+            try:
+                result, callback = self._results.get_nowait()
+            except queue.Empty:
+                return delivered
+            delivered = True
+            if result is not None and callback:
+                callback(result)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find Super Ball game pages under game folders")
+    parser.add_argument("roots", nargs="+", help="游戏根目录")
+    parser.add_argument("--snapshot", default="discovery_snapshot.json", help="扫描快照文件")
+    parser.add_argument("--workers", type=int, default=4, help="扫描线程数")
+    parser.add_argument("--json", action="store_true", help="以JSON输出")
+    args = parser.parse_args(argv)
+
+    discovery = GameDiscovery(args.roots, args.snapshot, args.workers)
+    try:
+        result = discovery.scan()
+    finally:
+        discovery.shutdown()
+    games = discovery.games()
+    if args.json:
+        print(json.dumps(dict(result, games=games), indent=4, ensure_ascii=False))
+        return 0
+    for path, meta in sorted(games.items()):
+        print(f"{meta['lang'] or '-':<6} {meta['version'] or '-':<6} {meta['title']:<24} {path}")
+    print(f"{len(games)} games in {result['dirs']} folders "
+          f"({result['listed']} listed, +{len(result['added'])} -{len(result['removed'])} "
+          f"~{len(result['changed'])}, {result['elapsed_ms']:.0f} ms)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
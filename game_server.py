@@ -0,0 +1,174 @@
+"""Super Ball 本地游戏服务器
+
+启动器通过回环HTTP服务器提供游戏页面：文件缓存在内存中并预先gzip压缩，
+支持 ETag / If-None-Match，文件修改时间变化后自动重新载入，并发送跨源隔离
+响应头以便页面使用 Worker 和 SharedArrayBuffer。缓存按总字节数限制大小，
+超出时淘汰最久未访问的文件。
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+import urllib.parse
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class _GameRequestHandler(BaseHTTPRequestHandler):
+    """游戏资源请求处理（只读，GET/HEAD）"""
+    server_version = "SuperBallLauncher/1.0"
+    
+    def do_GET(self):
+        self._serve(send_body=True)
+    
+    def do_HEAD(self):
+        self._serve(send_body=False)
+    
+    def _serve(self, send_body):
+        asset = self.server.game_server.lookup(urllib.parse.urlsplit(self.path).path)
+        if asset is None:
+            self.send_error(404)
+            return
+        
+        use_gzip = asset["gzip"] is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        etag = asset["etag_gzip"] if use_gzip else asset["etag"]
+        body = asset["gzip"] if use_gzip else asset["body"]
+        
+        # 弱比较：忽略 W/ 前缀，"*" 匹配任何版本
+        tags = [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]
+        not_modified = "*" in tags or etag in [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+        
+        self.send_response(304 if not_modified else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        # 跨源隔离，页面可使用 SharedArrayBuffer / Worker
+        self.send_header("Cross-Origin-Opener-Policy", "same-origin")
+        self.send_header("Cross-Origin-Embedder-Policy", "require-corp")
+        self.send_header("Cross-Origin-Resource-Policy", "same-origin")
+        if not_modified:
+            self.end_headers()
+            return
+        self.send_header("Content-Type", asset["content_type"])
+        self.send_header("Content-Length", str(len(body)))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+class GameServer:
+    """本地回环HTTP服务器，从内存缓存提供游戏页面"""
+    # 小于该大小的文件不压缩
+    GZIP_MIN_SIZE = 512
+    # 内存缓存上限（原文件加压缩版本的总字节数）
+    CACHE_MAX_BYTES = 64 * 1024 * 1024
+    
+    def __init__(self, host="127.0.0.1", port=0):
+        self.host = host
+        self.port = port
+        self.httpd = None
+        self._thread = None
+        self._lock = threading.Lock()
+        # 目录编号 -> 绝对目录；编号只用于生成URL
+        self.roots = {}
+        # 绝对路径 -> 缓存条目，按最近访问排序
+        self.cache = OrderedDict()
+        self.cache_bytes = 0
+    
+    def start(self):
+        """在后台线程启动服务器（已启动时直接返回）"""
+        if self.httpd is not None:
+            return
+        self.httpd = ThreadingHTTPServer((self.host, self.port), _GameRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.game_server = self
+        self.port = self.httpd.server_address[1]
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="game-server", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """停止服务器"""
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+    
+    def url_for(self, file_path):
+        """返回文件的HTTP地址，并预先载入缓存；同目录下的其他资源也可访问"""
+        self.start()
+        file_path = os.path.abspath(file_path)
+        directory, name = os.path.split(file_path)
+        root_id = hashlib.sha1(directory.encode('utf-8')).hexdigest()[:12]
+        with self._lock:
+            self.roots[root_id] = directory
+        self._load(file_path)
+        return f"http://{self.host}:{self.port}/{root_id}/{urllib.parse.quote(name)}"
+    
+    def lookup(self, url_path):
+        """把URL路径解析为缓存条目，越界或不存在时返回None"""
+        parts = url_path.lstrip("/").split("/", 1)
+        if len(parts) != 2:
+            return None
+        with self._lock:
+            directory = self.roots.get(parts[0])
+        if directory is None:
+            return None
+        file_path = os.path.abspath(os.path.join(directory, urllib.parse.unquote(parts[1])))
+        if os.path.commonpath([directory, file_path]) != directory:
+            return None
+        return self._load(file_path)
+    
+    def _load(self, file_path):
+        """读取缓存；文件的大小或修改时间变化后重新载入"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            with self._lock:
+                self._evict(file_path)
+            return None
+        signature = (st.st_size, st.st_mtime_ns)
+        with self._lock:
+            asset = self.cache.get(file_path)
+            if asset is not None and asset["signature"] == signature:
+                self.cache.move_to_end(file_path)
+                return asset
+        
+        try:
+            with open(file_path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+        compressed = gzip.compress(body, mtime=0) if len(body) >= self.GZIP_MIN_SIZE else None
+        if compressed is not None and len(compressed) >= len(body):
+            compressed = None
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        asset = {
+            "signature": signature,
+            "body": body,
+            "gzip": compressed,
+            "etag": f'"{digest}"',
+            "etag_gzip": f'"{digest}-gz"',
+            "content_type": content_type,
+            "size": len(body) + (len(compressed) if compressed is not None else 0),
+        }
+        with self._lock:
+            self._evict(file_path)
+            self.cache[file_path] = asset
+            self.cache_bytes += asset["size"]
+            # 超出上限时淘汰最久未访问的文件（刚载入的文件总会保留）
+            while self.cache_bytes > self.CACHE_MAX_BYTES and len(self.cache) > 1:
+                self._evict(next(iter(self.cache)))
+        return asset
+    
+    def _evict(self, file_path):
+        """从缓存移除一个文件（调用方持有锁）"""
+        asset = self.cache.pop(file_path, None)
+        if asset is not None:
+            self.cache_bytes -= asset["size"]
@@ -0,0 +1,878 @@
+"""Super Ball 启动器核心逻辑
+
+配置、会话统计、文件完整性清单以及启动游戏的流程。本模块不依赖 tkinter，
+图形界面 (launcher_ui) 和命令行模式 (main.py --launch/--stats/--verify) 共用。
+"""
+import os
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+import tempfile
+import atexit
+from contextlib import contextmanager
+import hashlib
+import queue
+
+from game_builder import GameBuilder, BuildError
+
+def atomic_write_json(file_path, data):
+    """原子写入JSON：先写同目录临时文件并fsync，再替换目标文件"""
+    payload = json.dumps(data, indent=4, ensure_ascii=False)
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp.", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def normalize_path(path):
+    """统一路径分隔符并规范化（旧配置中保存的是 Windows 风格的反斜杠路径）"""
+    if not path:
+        return ""
+    if os.sep != "\\":
+        path = path.replace("\\", "/")
+    return os.path.normpath(os.path.expanduser(path))
+
+# 配置项定义：类型、默认值，以及可选的取值范围 (choices)、路径标记 (path) 和附加检查 (check)
+CONFIG_SCHEMA = {
+    "language": {"type": str, "default": "Chinese"},
+    "version": {"type": str, "default": "v2.0", "choices": ("v1.0", "v2.0")},
+    "window_position": {
+        "type": dict,
+        "default": {"x": 100, "y": 100},
+        "check": lambda value: all(isinstance(value.get(axis), int) for axis in ("x", "y")),
+    },
+    "theme": {"type": str, "default": "dark", "choices": ("dark", "light", "gaming")},
+    "auto_launch": {"type": bool, "default": False},
+    "last_played": {"type": str, "default": ""},
+    "play_count": {"type": int, "default": 0},
+    "chinese_path": {"type": str, "default": "super_ball-HTMLfile/super_ball-chinese.html", "path": True},
+    "english_path": {"type": str, "default": "super_ball-HTMLfile/super_ball-english.html", "path": True},
+    "serve_http": {"type": bool, "default": True},
+    "browser_mode": {"type": str, "default": "app", "choices": ("app", "kiosk", "tab")},
+    "browser_path": {"type": str, "default": "", "path": True},
+    "browser_cache": {"type": dict, "default": {}},
+    "game_roots": {
+        "type": list,
+        "default": [],
+        "path": True,
+        "check": lambda value: all(isinstance(root, str) for root in value),
+    },
+    "watch_interval_ms": {"type": int, "default": 3000, "check": lambda value: value >= 0},
+}
+
+# 用户配置文件格式版本；没有该字段的是旧版（保存了全部键）的文件
+CONFIG_VERSION = 2
+
+def validate_value(key, value):
+    """按 CONFIG_SCHEMA 校验并规范化一个配置值，无效时抛出 ValueError"""
+    spec = CONFIG_SCHEMA.get(key)
+    if spec is None:
+        return value
+    expected = spec["type"]
+    if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+        raise ValueError(f"{key} 应为 {expected.__name__}，实际为 {value!r}")
+    if "choices" in spec and value not in spec["choices"]:
+        raise ValueError(f"{key} 只能是 {', '.join(spec['choices'])}，实际为 {value!r}")
+    if "check" in spec and not spec["check"](value):
+        raise ValueError(f"{key} 的值无效: {value!r}")
+    if spec.get("path"):
+        value = [normalize_path(path) for path in value] if isinstance(value, list) else normalize_path(value)
+    return value
+
+def validate_layer(data, source):
+    """校验一层配置，丢弃无效的值并给出提示"""
+    layer = {}
+    for key, value in data.items():
+        try:
+            layer[key] = validate_value(key, value)
+        except ValueError as e:
+            print(f"忽略{source}中的无效配置: {e}")
+    return layer
+
+def site_config_path():
+    """站点（全局）配置文件路径，可用环境变量 SUPERBALL_SITE_CONFIG 指定"""
+    path = os.environ.get("SUPERBALL_SITE_CONFIG")
+    if path:
+        return path
+    if os.name == "nt":
+        return os.path.join(os.environ.get("PROGRAMDATA", r"C:\ProgramData"), "SuperBall", "config.json")
+    return "/etc/superball/config.json"
+
+class GameConfig:
+    """游戏配置管理类
+
+    配置分四层，后面的覆盖前面的：内置默认值、站点配置文件、用户配置文件、本次运行的
+    临时覆盖。读取走合并后的缓存视图，只有某一层变化时才重建；站点配置中 "locked"
+    列出的键不能被用户配置覆盖。set() 只写用户层，对锁定的键的修改会被忽略并提示。
+    界面的定时扫描会调用 reload()，配置文件在外部被修改后重新载入。
+    """
+    def __init__(self, flush_delay=0.5, config_file="game_config.json", site_file=None):
+        self.config_file = config_file
+        self.site_file = site_file if site_file is not None else site_config_path()
+        self.default_config = {key: validate_value(key, spec["default"]) for key, spec in CONFIG_SCHEMA.items()}
+        # 写入合并：set() 只标记脏数据，由延迟定时器或事务结束统一落盘
+        self.flush_delay = flush_delay
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._batch_depth = 0
+        self._flush_timer = None
+        self._view = None
+        self._signatures = {}
+        self.site_layer, self.locked = self.load_site()
+        self.config_data = self.load_config()
+        self.session_layer = {}
+        atexit.register(self.flush)
+    
+    def _record_signature(self, path):
+        """记录文件签名 (大小, 修改时间)，文件不存在时为 None"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._signatures[path] = None
+            return None
+        self._signatures[path] = (st.st_size, st.st_mtime_ns)
+        return self._signatures[path]
+    
+    def _read_json(self, path):
+        """读取一层配置文件，记录文件签名供 reload() 判断是否变化"""
+        if self._record_signature(path) is None:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("配置文件顶层必须是对象")
+        return data
+    
+    def load_site(self):
+        """加载站点配置，返回 (配置层, 锁定的键)"""
+        try:
+            data = self._read_json(self.site_file)
+        except Exception as e:
+            print(f"加载站点配置失败: {e}")
+            return {}, frozenset()
+        if data is None:
+            return {}, frozenset()
+        locked = data.pop("locked", [])
+        return validate_layer(data, "站点配置"), frozenset(locked if isinstance(locked, list) else [])
+    
+    def load_config(self):
+        """加载用户配置文件"""
+        try:
+            data = self._read_json(self.config_file)
+        except Exception as e:
+            print(f"加载配置文件失败: {e}")
+            return {}
+        if data is None:
+            return {}
+        version = data.pop("config_version", 1)
+        layer = validate_layer(data, "配置文件")
+        if version < CONFIG_VERSION:
+            # 旧版文件合并保存了全部默认值；只保留用户改过的值，站点配置才能生效
+            layer = {key: value for key, value in layer.items() if value != self.default_config.get(key)}
+            self._dirty = True
+        return layer
+    
+    def reload(self):
+        """配置文件在磁盘上变化时重新加载对应的层，返回是否有变化
+
+        用户层还有未保存的修改时不重新加载它，随后的写入会覆盖外部的修改。
+        """
+        changed = False
+        for path in (self.site_file, self.config_file):
+            try:
+                st = os.stat(path)
+                signature = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                signature = None
+            if signature == self._signatures.get(path):
+                continue
+            with self._lock:
+                if path == self.site_file:
+                    self.site_layer, self.locked = self.load_site()
+                elif self._dirty:
+                    continue
+                else:
+                    self.config_data = self.load_config()
+                self._view = None
+            changed = True
+        return changed
+    
+    def view(self):
+        """合并后的配置（缓存，某一层变化时才重建）"""
+        view = self._view
+        if view is None:
+            with self._lock:
+                view = dict(self.default_config)
+                view.update(self.site_layer)
+                view.update(self.config_data)
+                for key in self.locked:
+                    if key in self.site_layer:
+                        view[key] = self.site_layer[key]
+                view.update(self.session_layer)
+                self._view = view
+        return view
+    
+    def save_config(self):
+        """保存配置文件（先写临时文件再原子替换，崩溃时不会留下半个文件）"""
+        # 在写锁内取快照：定时线程和主线程同时保存时，后写入磁盘的一定是较新的快照
+        with self._write_lock:
+            with self._lock:
+                snapshot = json.loads(json.dumps(self.config_data))
+                snapshot["config_version"] = CONFIG_VERSION
+                self._dirty = False
+            try:
+                atomic_write_json(self.config_file, snapshot)
+            except Exception as e:
+                print(f"保存配置文件失败: {e}")
+                with self._lock:
+                    self._dirty = True
+                return
+            # 记下自己写入的文件签名，reload() 不会把它当成外部修改
+            with self._lock:
+                self._record_signature(self.config_file)
+    
+    def get(self, key, default=None):
+        """获取配置值"""
+        return self.view().get(key, default)
+    
+    def set(self, key, value):
+        """设置配置值（写入用户层），值无效时抛出 ValueError，站点锁定的键不会被修改"""
+        value = validate_value(key, value)
+        save_now = False
+        with self._lock:
+            if key in self.locked and key in self.site_layer:
+                if value != self.site_layer[key]:
+                    print(f"配置项 {key} 已被站点配置锁定，忽略修改")
+                return
+            if self.config_data.get(key, self.view().get(key)) == value:
+                return
+            self.config_data[key] = value
+            self._view = None
+            self._dirty = True
+            if self._batch_depth == 0:
+                save_now = self._schedule_flush()
+        if save_now:
+            self.save_config()
+    
+    def override(self, key, value):
+        """只在本次运行中覆盖配置值，不写入文件"""
+        value = validate_value(key, value)
+        with self._lock:
+            self.session_layer[key] = value
+            self._view = None
+    
+    def update(self, values):
+        """批量设置配置值，只产生一次写入"""
+        with self.transaction():
+            for key, value in values.items():
+                self.set(key, value)
+    
+    @contextmanager
+    def transaction(self):
+        """事务块：块内的所有修改在结束时合并为一次写入"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            save_now = False
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    save_now = self._schedule_flush()
+            if save_now:
+                self.save_config()
+    
+    def _schedule_flush(self):
+        """安排一次延迟后台写入，连续修改会重置计时
+
+        调用方持有 _lock。flush_delay 为 0 时返回 True，由调用方在释放 _lock 之后
+        调用 save_config()（它先取 _write_lock 再取 _lock，持锁调用会死锁）。
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        
+        if self.flush_delay <= 0:
+            return True
+        
+        self._flush_timer = threading.Timer(self.flush_delay, self._flush_from_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+        return False
+    
+    def _flush_from_timer(self):
+        """定时器线程回调"""
+        with self._lock:
+            self._flush_timer = None
+            if not self._dirty or self._batch_depth > 0:
+                return
+        self.save_config()
+    
+    def flush(self):
+        """立即写入所有未保存的修改"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+        self.save_config()
+
+class SessionLog:
+    """追加写入的游戏会话日志，附带增量维护的按日/按周汇总"""
+    SEGMENT_SIZE = 1 << 20
+    
+    def __init__(self, log_dir="sessions", flush_every=20):
+        self.log_dir = log_dir
+        self.rollups_file = os.path.join(log_dir, "rollups.json")
+        self.flush_every = flush_every
+        self._unsaved = 0
+        self.rollups = self.load_rollups()
+        # 汇总只记录到日志中的某个位置，之后的记录（例如崩溃前未保存的）在此补齐
+        self._catch_up()
+        atexit.register(self.flush)
+    
+    @staticmethod
+    def _empty_rollups():
+        return {
+            "position": [1, 0],
+            "totals": {"count": 0, "latency_ms": 0.0, "languages": {}},
+            "daily": {},
+            "weekly": {},
+            "last_played": "",
+        }
+    
+    def load_rollups(self):
+        """加载汇总文件"""
+        try:
+            if os.path.exists(self.rollups_file):
+                with open(self.rollups_file, 'r', encoding='utf-8') as f:
+                    rollups = json.load(f)
+                for key, value in self._empty_rollups().items():
+                    rollups.setdefault(key, value)
+                return rollups
+        except Exception as e:
+            print(f"加载会话汇总失败: {e}")
+        return self._empty_rollups()
+    
+    def save_rollups(self):
+        """保存汇总文件"""
+        try:
+            os.makedirs(self.log_dir, exist_ok=True)
+            atomic_write_json(self.rollups_file, self.rollups)
+            self._unsaved = 0
+        except Exception as e:
+            print(f"保存会话汇总失败: {e}")
+    
+    def flush(self):
+        """保存尚未落盘的汇总"""
+        if self._unsaved:
+            self.save_rollups()
+    
+    def _segment_path(self, segment):
+        return os.path.join(self.log_dir, f"sessions-{segment:06d}.jsonl")
+    
+    def _catch_up(self):
+        """把汇总位置之后的日志记录计入汇总"""
+        segment, offset = self.rollups["position"]
+        while os.path.exists(self._segment_path(segment)):
+            with open(self._segment_path(segment), 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    try:
+                        self._apply(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue  # 损坏或缺少字段的记录跳过
+                    self._unsaved += 1
+            self.rollups["position"] = [segment, offset]
+            if not os.path.exists(self._segment_path(segment + 1)):
+                break
+            segment, offset = segment + 1, 0
+        self.flush()
+    
+    def _apply(self, record):
+        """把一条记录计入各级汇总（字段无效时抛出异常，且不改动汇总）"""
+        timestamp = datetime.fromisoformat(record["ts"])
+        language = record["lang"]
+        if not isinstance(language, str):
+            raise TypeError(f"无效的语言: {language!r}")
+        latency_ms = float(record.get("latency_ms", 0.0))
+        buckets = (
+            self.rollups["totals"],
+            self.rollups["daily"].setdefault(timestamp.strftime("%Y-%m-%d"), {}),
+            self.rollups["weekly"].setdefault(timestamp.strftime("%G-W%V"), {}),
+        )
+        for bucket in buckets:
+            bucket["count"] = bucket.get("count", 0) + 1
+            bucket["latency_ms"] = bucket.get("latency_ms", 0.0) + latency_ms
+            languages = bucket.setdefault("languages", {})
+            languages[language] = languages.get(language, 0) + 1
+        if record["ts"] > self.rollups["last_played"]:
+            self.rollups["last_played"] = record["ts"]
+    
+    def append(self, language, version, latency_ms, timestamp=None, via=None):
+        """追加一条会话记录并更新汇总"""
+        record = {
+            "ts": (timestamp or datetime.now()).isoformat(timespec="seconds"),
+            "lang": language,
+            "ver": version,
+            "latency_ms": round(latency_ms, 1),
+        }
+        if via:
+            record["via"] = via
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode('utf-8')
+        
+        segment, offset = self.rollups["position"]
+        if offset and offset + len(line) > self.SEGMENT_SIZE:
+            segment, offset = segment + 1, 0
+        os.makedirs(self.log_dir, exist_ok=True)
+        with open(self._segment_path(segment), 'ab') as f:
+            f.write(line)
+            offset = f.tell()
+        
+        self._apply(record)
+        self.rollups["position"] = [segment, offset]
+        self._unsaved += 1
+        if self._unsaved >= self.flush_every:
+            self.save_rollups()
+        return record
+    
+    def daily_counts(self, days=7, today=None):
+        """最近若干天每天的游戏次数，按日期升序"""
+        today = today or datetime.now().date()
+        result = []
+        for i in range(days - 1, -1, -1):
+            day = (today - timedelta(days=i)).strftime("%Y-%m-%d")
+            result.append((day, self.rollups["daily"].get(day, {}).get("count", 0)))
+        return result
+    
+    def week_count(self, day=None):
+        """某天所在周的游戏次数"""
+        week = (day or datetime.now()).strftime("%G-W%V")
+        return self.rollups["weekly"].get(week, {}).get("count", 0)
+
+class GameStats:
+    """游戏统计类"""
+    def __init__(self, game_config, session_log=None):
+        self.game_config = game_config
+        self.session_log = session_log or SessionLog()
+        self._import_legacy()
+    
+    def _import_legacy(self):
+        """把旧版配置中的游戏次数和最后游戏时间并入汇总（只做一次）"""
+        rollups = self.session_log.rollups
+        if "legacy_count" in rollups:
+            return
+        rollups["legacy_count"] = self.game_config.get("play_count", 0)
+        last_played = self.game_config.get("last_played", "")
+        if last_played > rollups["last_played"]:
+            rollups["last_played"] = last_played
+        self.session_log.save_rollups()
+    
+    def record_session(self, language, version, latency_ms, via=None):
+        """记录一次游戏启动"""
+        self.session_log.append(language, version, latency_ms, via=via)
+    
+    def get_stats(self):
+        """获取统计信息"""
+        rollups = self.session_log.rollups
+        totals = rollups["totals"]
+        return {
+            "play_count": totals["count"] + rollups.get("legacy_count", 0),
+            "last_played": rollups["last_played"] or "从未游戏",
+            "this_week": self.session_log.week_count(),
+            "avg_latency_ms": totals["latency_ms"] / totals["count"] if totals["count"] else 0.0,
+            "history": self.session_log.daily_counts(7),
+        }
+
+class FileManifest:
+    """游戏文件完整性清单（大小、修改时间、SHA-256）"""
+    CHUNK_SIZE = 1 << 16
+    STATUS_TEXT = {
+        "ok": "✅ Found",
+        "modified": "⚠️ Modified",
+        "missing": "❌ Missing",
+        "empty": "❌ Empty",
+        "error": "❌ Unreadable",
+        "unknown": "⏳ Checking",
+    }
+    
+    def __init__(self, manifest_file="game_manifest.json", max_workers=2):
+        self.manifest_file = manifest_file
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        # 绝对路径 -> {"size", "mtime_ns", "sha256", "trusted_sha256"}
+        self.entries = self.load_manifest()
+        # 绝对路径 -> 最近一次校验结论，只在Tk线程读写
+        self.verdicts = {}
+        self.pending = 0
+        self._changed = False
+        self._executor = None
+        self._results = queue.Queue()
+    
+    def load_manifest(self):
+        """加载清单文件"""
+        try:
+            if os.path.exists(self.manifest_file):
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"加载文件清单失败: {e}")
+        return {}
+    
+    def save_manifest(self):
+        """保存清单文件"""
+        with self._lock:
+            snapshot = {path: dict(entry) for path, entry in self.entries.items()}
+        try:
+            atomic_write_json(self.manifest_file, snapshot)
+        except Exception as e:
+            print(f"保存文件清单失败: {e}")
+    
+    @staticmethod
+    def _key(path):
+        return os.path.abspath(path)
+    
+    def status(self, path):
+        """读取缓存的校验结论，不访问磁盘"""
+        return self.verdicts.get(self._key(path), "unknown")
+    
+    def _hash_file(self, path):
+        """流式计算文件哈希"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def verify(self, path):
+        """校验单个文件，只有大小或修改时间变化时才重新计算哈希"""
+        key = self._key(path)
+        try:
+            st = os.stat(key)
+        except FileNotFoundError:
+            return "missing"
+        except OSError:
+            return "error"
+        if st.st_size == 0:
+            return "empty"
+        
+        with self._lock:
+            entry = dict(self.entries.get(key, {}))
+        if entry.get("size") != st.st_size or entry.get("mtime_ns") != st.st_mtime_ns:
+            try:
+                sha256 = self._hash_file(key)
+            except OSError:
+                return "error"
+            entry.update(size=st.st_size, mtime_ns=st.st_mtime_ns, sha256=sha256)
+            # 首次登记的内容即为可信基准
+            entry.setdefault("trusted_sha256", sha256)
+            with self._lock:
+                self.entries[key] = entry
+                self._changed = True
+        return "ok" if entry["sha256"] == entry["trusted_sha256"] else "modified"
+    
+    def check(self, path):
+        """同步校验单个文件并记录结论（在Tk线程调用）"""
+        verdict = self.verify(path)
+        self.verdicts[self._key(path)] = verdict
+        with self._lock:
+            changed, self._changed = self._changed, False
+        if changed:
+            self.save_manifest()
+        return verdict
+    
+    def accept(self, path):
+        """将文件当前内容登记为可信基准"""
+        key = self._key(path)
+        with self._lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return
+            entry["trusted_sha256"] = entry["sha256"]
+        self.verdicts[key] = "ok"
+        self.save_manifest()
+    
+    def verify_async(self, paths, callback=None):
+        """在线程池中校验一批文件；结果需在Tk线程调用 deliver() 取回"""
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="manifest"
+            )
+        batch = {"remaining": len(paths), "results": {}, "callback": callback}
+        self.pending += 1
+        for path in paths:
+            future = self._executor.submit(self.verify, path)
+            future.add_done_callback(lambda f, p=path: self._on_verified(batch, p, f))
+    
+    def _on_verified(self, batch, path, future):
+        """工作线程回调：汇总一批结果，全部完成后放入结果队列"""
+        try:
+            verdict = future.result()
+        except Exception as e:
+            print(f"校验文件失败: {e}")
+            verdict = "error"
+        with self._lock:
+            batch["results"][path] = verdict
+            batch["remaining"] -= 1
+            done = batch["remaining"] == 0
+            changed = done and self._changed
+            if changed:
+                self._changed = False
+        if done:
+            if changed:
+                self.save_manifest()
+            self._results.put(batch)
+    
+    def deliver(self):
+        """在Tk线程中取回已完成的批次并执行回调，返回是否有新结果"""
+        delivered = False
+        while True:
+            try:
+                batch = self._results.get_nowait()
+            except queue.Empty:
+                return delivered
+            self.pending -= 1
+            for path, verdict in batch["results"].items():
+                self.verdicts[self._key(path)] = verdict
+            if batch["callback"]:
+                batch["callback"](batch["results"])
+            delivered = True
+
+class StartupProfiler:
+    """启动阶段计时（--profile-startup 时输出报告）"""
+    def __init__(self, start=None, enabled=False):
+        self.enabled = enabled
+        self.start = start if start is not None else time.perf_counter()
+        self.last = self.start
+        self.phases = []
+    
+    def mark(self, name):
+        """记录从上一个标记到现在的耗时"""
+        now = time.perf_counter()
+        self.phases.append((name, (now - self.last) * 1000))
+        self.last = now
+    
+    def report(self):
+        """输出各阶段耗时"""
+        print("Startup profile (ms):")
+        for name, elapsed in self.phases:
+            print(f"  {name:<24} {elapsed:8.1f}")
+        print(f"  {'total':<24} {(self.last - self.start) * 1000:8.1f}")
+
+class LauncherCore:
+    """启动器的非界面逻辑，图形界面和命令行共用"""
+    def __init__(self, overrides=None):
+        self.game_config = GameConfig()
+        for key, value in (overrides or {}).items():
+            self.game_config.override(key, value)
+        self.stats = GameStats(self.game_config)
+        self.manifest = FileManifest()
+        self.builder = GameBuilder()
+        self.game_server = None
+        self.browser = None
+        self._catalog = None
+        self._discovery = None
+    
+    @property
+    def catalog(self):
+        """游戏目录（首次使用时打开数据库）"""
+        if self._catalog is None:
+            from game_catalog import GameCatalog
+            self._catalog = GameCatalog()
+        return self._catalog
+    
+    def sync_catalog(self):
+        """把模板编译的各语言、各版本游戏登记到目录（来源 builtin）"""
+        entries = []
+        for language in self.builder.languages():
+            path = self.get_game_path(language)
+            if not path:
+                continue
+            for version in CONFIG_SCHEMA["version"]["choices"]:
+                entries.append({
+                    "path": path,
+                    "title": "Super Ball",
+                    "language": language,
+                    "version": version,
+                    "tags": ["builtin", language.lower()],
+                })
+        try:
+            self.catalog.sync("builtin", entries)
+        except Exception as e:
+            print(f"更新游戏目录失败: {e}")
+    
+    @property
+    def discovery(self):
+        """游戏目录扫描器（首次使用时创建）"""
+        if self._discovery is None:
+            from game_discovery import GameDiscovery
+            self._discovery = GameDiscovery(self.watch_roots())
+        return self._discovery
+    
+    def builtin_languages(self):
+        """字符串表中的语言（字符串表缺失或无效时为空列表）"""
+        try:
+            return self.builder.languages()
+        except (OSError, ValueError, BuildError) as e:
+            print(f"读取字符串表失败: {e}")
+            return []
+    
+    def watch_roots(self):
+        """需要扫描的目录：配置的游戏根目录以及内置页面所在目录"""
+        roots = list(self.game_config.get("game_roots", []))
+        for language in self.builtin_languages():
+            path = self.get_game_path(language)
+            if path:
+                roots.append(os.path.dirname(os.path.abspath(path)))
+        return list(dict.fromkeys(os.path.abspath(root) for root in roots))
+    
+    def add_game_root(self, folder):
+        """添加游戏根目录，返回是否为新目录"""
+        folder = normalize_path(folder)
+        roots = list(self.game_config.get("game_roots", []))
+        if folder in roots:
+            return False
+        self.game_config.set("game_roots", roots + [folder])
+        self.discovery.set_roots(self.watch_roots())
+        return True
+    
+    def sync_discovered(self):
+        """把扫描发现的游戏页面登记到目录（来源 discovered，内置页面除外）"""
+        builtin = {os.path.abspath(self.get_game_path(language)) for language in self.builtin_languages()}
+        try:
+            languages = {entry.get("lang"): name for name, entry in self.builder.load_table().items()}
+        except (OSError, ValueError, BuildError):
+            languages = {}  # 无法读取字符串表时保留页面中的语言代码
+        versions = CONFIG_SCHEMA["version"]["choices"]
+        entries = []
+        for path, meta in self.discovery.games().items():
+            if path in builtin:
+                continue
+            title = meta["title"]
+            if title == "Super Ball":
+                title = os.path.splitext(os.path.basename(path))[0]
+            for version in ([meta["version"]] if meta["version"] in versions else versions):
+                entries.append({
+                    "path": path,
+                    "title": title,
+                    "language": languages.get(meta["lang"], meta["lang"]),
+                    "version": version,
+                    "event": meta["event"],
+                    "tags": ["discovered", meta["event"]],
+                })
+        try:
+            return self.catalog.sync("discovered", entries)
+        except Exception as e:
+            print(f"更新游戏目录失败: {e}")
+            return 0, 0
+    
+    def discover(self):
+        """同步扫描游戏目录并更新游戏目录，返回扫描结果"""
+        result = self.discovery.scan()
+        self.sync_discovered()
+        return result
+    
+    def get_game_path(self, language):
+        """获取游戏文件路径（未配置时使用模板编译产物）"""
+        path = self.game_config.get(f"{language.lower()}_path")
+        if not path:
+            try:
+                path = self.builder.output_path(language)
+            except (OSError, ValueError, BuildError):
+                path = ""
+        return path
+    
+    def build_games(self):
+        """按需从模板编译各语言游戏页面，重新生成的文件登记为可信内容"""
+        try:
+            _, rebuilt = self.builder.build()
+        except (OSError, ValueError, BuildError) as e:
+            print(f"编译游戏页面失败: {e}")
+            return
+        for path in rebuilt:
+            self.manifest.check(path)
+            self.manifest.accept(path)
+    
+    def file_status(self, language):
+        """读取游戏文件的缓存校验结论"""
+        return self.manifest.status(self.get_game_path(language))
+    
+    def check_file_exists(self, language):
+        """检查游戏文件是否存在"""
+        return self.file_status(language) in ("ok", "modified")
+    
+    def prepare_launch(self, language, file_path=None):
+        """启动前准备：编译过期页面并取得校验结论，返回 (文件路径, 结论)
+        
+        file_path 为目录中的游戏页面，不指定时使用该语言的内置页面。
+        """
+        self.build_games()
+        file_path = file_path or self.get_game_path(language)
+        # 读取缓存的校验结论，尚未校验过时才同步校验
+        status = self.manifest.status(file_path)
+        if status == "unknown":
+            status = self.manifest.check(file_path)
+        return file_path, status
+    
+    def get_game_url(self, file_path, serve=None):
+        """获取游戏地址：优先通过本地HTTP服务器，失败时退回 file:// 地址"""
+        if serve is None:
+            serve = self.game_config.get("serve_http", True)
+        if serve:
+            try:
+                if self.game_server is None:
+                    from game_server import GameServer
+                    self.game_server = GameServer()
+                return self.game_server.url_for(file_path)
+            except OSError as e:
+                print(f"启动本地游戏服务器失败: {e}")
+        from pathlib import Path
+        return Path(os.path.abspath(file_path)).as_uri()
+    
+    def open_game(self, language, version, file_path, launch_start, serve=None):
+        """在浏览器中打开游戏（已有窗口则复用）并记录本次会话，返回启动记录"""
+        url = self.get_game_url(file_path, serve)
+        if self.browser is None:
+            from browser_launcher import BrowserLauncher
+            self.browser = BrowserLauncher(self.game_config)
+        launch = self.browser.open(url)
+        # 启动耗时从用户发起启动算起，包含编译、校验和浏览器启动
+        launch["total_ms"] = round((time.perf_counter() - launch_start) * 1000, 1)
+        self.stats.record_session(language, version, launch["total_ms"], via=launch["method"])
+        if self._catalog is not None:
+            try:
+                self._catalog.record_play(file_path, version)
+            except Exception as e:
+                print(f"更新游戏目录失败: {e}")
+        return launch
+    
+    def shutdown(self):
+        """保存未写入的数据并停止本地服务器"""
+        self.game_config.flush()
+        self.stats.session_log.flush()
+        if self.game_server is not None:
+            self.game_server.stop()
+            self.game_server = None
+        if self._catalog is not None:
+            self._catalog.close()
+            self._catalog = None
+        if self._discovery is not None:
+            self._discovery.shutdown()
+            self._discovery = None
@@ -0,0 +1,1489 @@
+"""Super Ball 启动器图形界面"""
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+import math
+import sys
+import time
+from datetime import datetime
+from collections import OrderedDict
+
+from launcher_core import FileManifest, LauncherCore, StartupProfiler
+
+# 缓动曲线: 输入进度 t∈[0, 1]，输出插值系数
+EASINGS = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: 1 - (1 - t) * (1 - t),
+    "ease_in_out": lambda t: t * t * (3 - 2 * t),
+    "pulse": lambda t: math.sin(math.pi * t),
+}
+
+class Tween:
+    """单个补间动画"""
+    __slots__ = ("key", "duration", "step", "easing", "callback", "restore", "start_time")
+    
+    def __init__(self, key, duration, step, easing, callback, restore=None):
+        self.key = key
+        self.duration = max(duration, 1) / 1000
+        self.step = step
+        self.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        self.callback = callback
+        # 取消时把组件恢复到原值
+        self.restore = restore
+        self.start_time = None
+
+class AnimationHandler:
+    """动画处理类（所有动画在Tk线程上由同一个 after() 节拍驱动）"""
+    def __init__(self, master, frame_interval=16, frame_budget=8):
+        self.master = master
+        self.frame_interval = frame_interval
+        self.frame_budget = frame_budget / 1000
+        # (组件, 属性) -> Tween；同一目标的新动画会替换旧动画
+        self.animations = OrderedDict()
+        self._tick_id = None
+        self._color_cache = {}
+        # 动画开始前的属性原值，同一目标的动画被合并时沿用
+        self._base_values = {}
+    
+    def animate(self, widget, prop, duration, step, easing="ease_out", callback=None, restore=None):
+        """启动补间动画，step(factor) 每帧调用一次；restore() 在动画被取消时恢复组件"""
+        key = (str(widget), prop)
+        self.animations.pop(key, None)
+        tween = Tween(key, duration, step, easing, callback, restore)
+        self.animations[key] = tween
+        if self._tick_id is None:
+            self._tick_id = self.master.after(self.frame_interval, self._tick)
+        return tween
+    
+    def _drop(self, key):
+        """移除动画并把组件恢复到原值（不触发回调）"""
+        tween = self.animations.pop(key)
+        self._base_values.pop(key, None)
+        if tween.restore:
+            try:
+                tween.restore()
+            except tk.TclError:
+                pass  # 组件已销毁
+    
+    def cancel(self, widget, prop=None):
+        """取消组件上的动画（不触发回调）"""
+        name = str(widget)
+        for key in [k for k in self.animations if k[0] == name and (prop is None or k[1] == prop)]:
+            self._drop(key)
+    
+    def cancel_all(self):
+        """取消所有动画"""
+        for key in list(self.animations):
+            self._drop(key)
+        if self._tick_id is not None:
+            self.master.after_cancel(self._tick_id)
+            self._tick_id = None
+    
+    def _tick(self):
+        """共享节拍：在帧预算内推进尽可能多的动画，超出预算的留到下一帧"""
+        self._tick_id = None
+        frame_start = time.perf_counter()
+        deadline = frame_start + self.frame_budget
+        finished = []
+        
+        for key in list(self.animations):
+            if time.perf_counter() > deadline:
+                break
+            tween = self.animations.get(key)
+            if tween is None:
+                continue
+            if tween.start_time is None:
+                tween.start_time = frame_start
+            progress = min((frame_start - tween.start_time) / tween.duration, 1.0)
+            try:
+                tween.step(tween.easing(progress))
+            except tk.TclError:
+                # 组件已销毁
+                self.animations.pop(key, None)
+                self._base_values.pop(key, None)
+                continue
+            # 轮转顺序，避免预算不足时总是饿死队尾的动画
+            self.animations.move_to_end(key)
+            if progress >= 1.0:
+                self.animations.pop(key, None)
+                self._base_values.pop(key, None)
+                finished.append(tween)
+        
+        for tween in finished:
+            if tween.callback:
+                tween.callback()
+        
+        if self.animations and self._tick_id is None:
+            self._tick_id = self.master.after(self.frame_interval, self._tick)
+    
+    def _base_value(self, widget, prop, current):
+        """取得动画目标属性的原值（合并进行中的动画时不读取中间值）"""
+        key = (str(widget), prop)
+        if key not in self.animations or key not in self._base_values:
+            self._base_values[key] = current()
+        return self._base_values[key]
+    
+    def fade_in(self, widget, duration=1000, easing="ease_out"):
+        """淡入动画（前景色从背景色渐变到原前景色）"""
+        start_color = widget.cget("bg")
+        end_color = self._base_value(widget, "fg", lambda: widget.cget("fg"))
+        
+        def step(factor):
+            widget.configure(fg=self._interpolate_color(start_color, end_color, factor))
+        
+        return self.animate(widget, "fg", duration, step, easing,
+                            restore=lambda: widget.configure(fg=end_color))
+    
+    def _parse_color(self, color):
+        """将颜色解析为 (r, g, b)，结果缓存"""
+        rgb = self._color_cache.get(color)
+        if rgb is None:
+            if len(color) == 7 and color.startswith("#"):
+                rgb = tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+            else:
+                rgb = tuple(c >> 8 for c in self.master.winfo_rgb(color))
+            self._color_cache[color] = rgb
+        return rgb
+    
+    def _interpolate_color(self, color1, color2, factor):
+        """颜色插值"""
+        factor = min(max(factor, 0.0), 1.0)
+        r1, g1, b1 = self._parse_color(color1)
+        r2, g2, b2 = self._parse_color(color2)
+        return "#{:02x}{:02x}{:02x}".format(
+            round(r1 + (r2 - r1) * factor),
+            round(g1 + (g2 - g1) * factor),
+            round(b1 + (b2 - b1) * factor),
+        )
+    
+    def bounce_effect(self, widget, callback=None, scale=0.2, duration=200):
+        """弹跳效果（字体大小先放大再恢复）"""
+        base_font = self._base_value(widget, "font", lambda: widget.cget("font"))
+        pulse_font = tkfont.Font(root=self.master, font=base_font)
+        base_size = pulse_font.actual("size")
+        widget.configure(font=pulse_font)
+        
+        def step(factor):
+            pulse_font.configure(size=round(base_size * (1 + scale * factor)))
+        
+        def done():
+            widget.configure(font=base_font)
+            if callback:
+                callback()
+        
+        return self.animate(widget, "font", duration, step, "pulse", done,
+                            restore=lambda: widget.configure(font=base_font))
+
+class ThemeManager:
+    """主题管理类"""
+    def __init__(self):
+        self.themes = {
+            "dark": {
+                "bg": "#1e1e2f",
+                "fg": "#ffffff",
+                "button_bg": "#61dafb",
+                "button_fg": "#ffffff",
+                "button_active": "#21a1f1",
+                "frame_bg": "#2d2d44",
+                "accent": "#ff6b6b"
+            },
+            "light": {
+                "bg": "#f0f0f0",
+                "fg": "#333333",
+                "button_bg": "#007acc",
+                "button_fg": "#ffffff", 
+                "button_active": "#005999",
+                "frame_bg": "#e0e0e0",
+                "accent": "#e74c3c"
+            },
+            "gaming": {
+                "bg": "#0d1117",
+                "fg": "#00ff00",
+                "button_bg": "#ff0080",
+                "button_fg": "#ffffff",
+                "button_active": "#cc0066",
+                "frame_bg": "#161b22",
+                "accent": "#ffff00"
+            }
+        }
+    
+        self.active_theme = None
+        # 已登记组件: [(widget, {颜色选项: 主题角色})]
+        self._registry = []
+    
+    def get_theme(self, theme_name):
+        """获取主题配置"""
+        return self.themes.get(theme_name, self.themes["dark"])
+    
+    def activate(self, theme_name):
+        """设定当前主题（不修改任何组件），返回主题配置"""
+        self.active_theme = theme_name
+        return self.get_theme(theme_name)
+    
+    def register(self, widget, **roles):
+        """登记组件颜色选项所对应的主题角色，例如 register(label, fg="fg", bg="bg")"""
+        self._registry.append((widget, roles))
+        return widget
+    
+    def apply(self, theme_name):
+        """原地为已登记组件换肤，只配置颜色实际发生变化的选项"""
+        new_theme = self.get_theme(theme_name)
+        old_theme = self.get_theme(self.active_theme) if self.active_theme else {}
+        changed = {role for role, color in new_theme.items() if old_theme.get(role) != color}
+        
+        alive = []
+        for widget, roles in self._registry:
+            options = {option: new_theme[role] for option, role in roles.items() if role in changed}
+            try:
+                if options:
+                    configure = getattr(widget, "restyle", None) or widget.configure
+                    configure(**options)
+                elif not widget.winfo_exists():
+                    continue
+            except tk.TclError:
+                # 组件已被销毁，从登记表中移除
+                continue
+            alive.append((widget, roles))
+        
+        self._registry = alive
+        self.active_theme = theme_name
+        return new_theme
+
+class CustomButton(tk.Button):
+    """自定义按钮类"""
+    def __init__(self, parent, text="", command=None, **kwargs):
+        # 设置默认样式
+        default_style = {
+            'font': ('Helvetica', 12, 'bold'),
+            'relief': tk.FLAT,
+            'bd': 0,
+            'cursor': 'hand2',
+            'activebackground': '#21a1f1',
+            'activeforeground': 'white'
+        }
+        default_style.update(kwargs)
+        
+        super().__init__(parent, text=text, command=command, **default_style)
+        
+        # 绑定鼠标事件
+        self.bind('<Enter>', self.on_enter)
+        self.bind('<Leave>', self.on_leave)
+        self.bind('<Button-1>', self.on_click)
+        self.bind('<ButtonRelease-1>', self.on_release)
+        
+        self.original_bg = self.cget('bg')
+        self.hover_bg = kwargs.get('activebackground', '#21a1f1')
+    
+    def on_enter(self, event):
+        """鼠标进入"""
+        self.configure(bg=self.hover_bg)
+        self.configure(relief=tk.RAISED)
+    
+    def on_leave(self, event):
+        """鼠标离开"""
+        self.configure(bg=self.original_bg)
+        self.configure(relief=tk.FLAT)
+    
+    def on_click(self, event):
+        """鼠标按下"""
+        self.configure(relief=tk.SUNKEN)
+    
+    def on_release(self, event):
+        """鼠标释放"""
+        self.configure(relief=tk.RAISED)
+    
+    def restyle(self, **options):
+        """更新颜色，同时刷新悬停状态使用的颜色"""
+        if 'bg' in options:
+            self.original_bg = options['bg']
+        if 'activebackground' in options:
+            self.hover_bg = options['activebackground']
+        self.configure(**options)
+
+class VirtualList(tk.Frame):
+    """虚拟列表：只为可见的行创建画布元素，滚动时复用这些元素并重新填充文字
+    
+    行的内容通过 fetch(keys) -> {key: 文字} 按需读取，并缓存最近读取过的行。
+    """
+    CACHE_SIZE = 512
+    
+    def __init__(self, parent, fetch, rows=6, row_height=24, on_select=None, on_activate=None,
+                 bg="#2d2d44", fg="#ffffff", selectbackground="#61dafb", font=("Helvetica", 11)):
+        super().__init__(parent, bg=bg)
+        self.fetch = fetch
+        self.row_height = row_height
+        self.on_select = on_select
+        self.on_activate = on_activate
+        self.keys = []
+        self.offset = 0
+        self.selected = None
+        self._selected_index = None
+        self._cache = OrderedDict()
+        self._draw_id = None
+        self.colors = {"bg": bg, "fg": fg, "selectbackground": selectbackground}
+        
+        self.canvas = tk.Canvas(self, height=rows * row_height, bg=bg, highlightthickness=0, takefocus=True)
+        self.scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self._highlight = self.canvas.create_rectangle(0, 0, 0, 0, fill=selectbackground, width=0, state=tk.HIDDEN)
+        # 复用的行元素，数量只取决于可见高度
+        self._items = []
+        self.font = font
+        
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Double-Button-1>", self._on_double_click)
+        self.canvas.bind("<MouseWheel>", lambda event: self.yview("scroll", -1 if event.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+        self.canvas.bind("<Up>", lambda event: self.move_selection(-1))
+        self.canvas.bind("<Down>", lambda event: self.move_selection(1))
+        self.canvas.bind("<Prior>", lambda event: self.move_selection(-self._visible_rows()))
+        self.canvas.bind("<Next>", lambda event: self.move_selection(self._visible_rows()))
+        self.canvas.bind("<Return>", lambda event: self._activate())
+    
+    def set_keys(self, keys):
+        """替换列表内容（例如新的搜索结果），保留仍在结果中的选中项"""
+        self.keys = keys
+        self._selected_index = None
+        if self.selected is not None:
+            try:
+                self._selected_index = keys.index(self.selected)
+            except ValueError:
+                self.selected = None
+        self.offset = 0
+        if self._selected_index is not None:
+            self.see(self._selected_index)
+        self.redraw()
+    
+    def invalidate(self, keys=None):
+        """丢弃缓存的行内容（内容有变化时），下次绘制重新读取"""
+        if keys is None:
+            self._cache.clear()
+        else:
+            for key in keys:
+                self._cache.pop(key, None)
+        self.redraw()
+    
+    def select(self, key, notify=True):
+        """选中一行并滚动到可见位置"""
+        self.selected = key
+        try:
+            self._selected_index = self.keys.index(key)
+        except ValueError:
+            self._selected_index = None
+        if self._selected_index is not None:
+            self.see(self._selected_index)
+        self.redraw()
+        if notify and self.on_select and key is not None:
+            self.on_select(key)
+    
+    def move_selection(self, delta):
+        if not self.keys:
+            return
+        index = 0 if self._selected_index is None else self._selected_index + delta
+        self.select(self.keys[max(0, min(len(self.keys) - 1, index))])
+    
+    def see(self, index):
+        """调整滚动位置使第 index 行可见"""
+        top = index * self.row_height
+        height = self._view_height()
+        if top < self.offset:
+            self.offset = top
+        elif top + self.row_height > self.offset + height:
+            self.offset = top + self.row_height - height
+        self._clamp()
+    
+    def yview(self, *args):
+        """滚动条协议: moveto 比例 / scroll 数量 units|pages"""
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.keys) * self.row_height)
+        elif args[0] == "scroll":
+            step = self.row_height if args[2] == "units" else max(self.row_height, self._view_height() - self.row_height)
+            self.offset += int(args[1]) * step
+        self._clamp()
+        self.redraw()
+    
+    def restyle(self, **options):
+        """主题切换时更新颜色"""
+        self.colors.update(options)
+        if "bg" in options:
+            self.configure(bg=options["bg"])
+            self.canvas.configure(bg=options["bg"])
+        if "selectbackground" in options:
+            self.canvas.itemconfigure(self._highlight, fill=options["selectbackground"])
+        if "fg" in options:
+            for item in self._items:
+                self.canvas.itemconfigure(item, fill=options["fg"])
+    
+    def _view_height(self):
+        return max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+    
+    def _visible_rows(self):
+        return max(1, self._view_height() // self.row_height)
+    
+    def _clamp(self):
+        limit = max(0, len(self.keys) * self.row_height - self._view_height())
+        self.offset = max(0, min(self.offset, limit))
+    
+    def redraw(self):
+        """安排一次重绘，同一轮事件内的多次请求合并"""
+        if self._draw_id is None:
+            self._draw_id = self.after_idle(self._draw)
+    
+    def _rows(self, keys):
+        """读取行内容（优先使用缓存）"""
+        missing = [key for key in keys if key not in self._cache]
+        if missing:
+            self._cache.update(self.fetch(missing))
+        rows = []
+        for key in keys:
+            self._cache.move_to_end(key)
+            rows.append(self._cache.get(key, ""))
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return rows
+    
+    def _draw(self):
+        self._draw_id = None
+        height = self._view_height()
+        self._clamp()
+        first = self.offset // self.row_height
+        shift = self.offset - first * self.row_height
+        slots = height // self.row_height + 2
+        while len(self._items) < slots:
+            self._items.append(self.canvas.create_text(
+                8, 0, anchor=tk.W, font=self.font, fill=self.colors["fg"]
+            ))
+        
+        rows = self._rows(self.keys[first:first + slots])
+        for slot, item in enumerate(self._items):
+            if slot < len(rows):
+                y = slot * self.row_height - shift + self.row_height / 2
+                self.canvas.coords(item, 8, y)
+                self.canvas.itemconfigure(item, text=rows[slot], state=tk.NORMAL)
+            else:
+                self.canvas.itemconfigure(item, state=tk.HIDDEN)
+        
+        index = self._selected_index
+        if index is not None and first <= index < first + slots:
+            y = index * self.row_height - self.offset
+            self.canvas.coords(self._highlight, 0, y, self.canvas.winfo_width(), y + self.row_height)
+            self.canvas.itemconfigure(self._highlight, state=tk.NORMAL)
+        else:
+            self.canvas.itemconfigure(self._highlight, state=tk.HIDDEN)
+        
+        total = len(self.keys) * self.row_height
+        if total > height:
+            self.scrollbar.set(self.offset / total, (self.offset + height) / total)
+        else:
+            self.scrollbar.set(0, 1)
+    
+    def _index_at(self, y):
+        index = (self.offset + int(y)) // self.row_height
+        return index if 0 <= index < len(self.keys) else None
+    
+    def _on_click(self, event):
+        self.canvas.focus_set()
+        index = self._index_at(event.y)
+        if index is not None:
+            self.select(self.keys[index])
+    
+    def _on_double_click(self, event):
+        if self._index_at(event.y) is not None:
+            self._activate()
+    
+    def _activate(self):
+        if self.on_activate and self.selected is not None:
+            self.on_activate(self.selected)
+
+class ObservableModel:
+    """可观察的界面状态：字段变化时通知订阅者，同一轮事件循环内的修改合并为一次通知"""
+    def __init__(self, schedule, **values):
+        # schedule(callback) 安排回调在本轮事件处理结束后执行（例如 widget.after_idle）
+        self.schedule = schedule
+        self.values = dict(values)
+        self._changed = set()
+        self._scheduled = False
+        self._subscribers = []
+    
+    def get(self, name):
+        return self.values.get(name)
+    
+    def set(self, **values):
+        """更新字段，值未变化的字段不会触发通知"""
+        for name, value in values.items():
+            if name in self.values and self.values[name] == value:
+                continue
+            self.values[name] = value
+            self._changed.add(name)
+        if self._changed and not self._scheduled:
+            self._scheduled = True
+            self.schedule(self._notify)
+    
+    def subscribe(self, callback):
+        """callback(changed) 在字段变化后被调用，changed 为变化的字段名集合"""
+        self._subscribers.append(callback)
+    
+    def _notify(self):
+        changed, self._changed = self._changed, set()
+        self._scheduled = False
+        for callback in self._subscribers:
+            callback(changed)
+
+class StatsPanel:
+    """统计面板：每段文字绑定到模型的若干字段，只重写内容变化的行"""
+    SEPARATOR = "=" * 25
+    
+    def __init__(self, text_widget, model):
+        self.text = text_widget
+        self.model = model
+        separator = self.SEPARATOR
+        system_info = "\n".join([
+            "",
+            "💾 System Information:",
+            separator,
+            f"🐍 Python: {sys.version[:5]}",
+            f"🖥️ Platform: {sys.platform}",
+            "📊 Memory Usage: Normal",
+            "🔄 Status: Ready",
+        ])
+        # (依赖的字段, 生成文字的函数)，文字可以包含多行
+        self.bindings = [
+            ((), lambda m: f"\n📊 GAME STATISTICS\n{separator}\n"),
+            (("play_count",), lambda m: f"🎮 Total Games Played: {m['play_count']}"),
+            (("this_week",), lambda m: f"📆 This Week: {m['this_week']}"),
+            (("last_played",), lambda m: "📅 Last Played: " + (
+                m["last_played"][:10] if m["last_played"] != "从未游戏" else "Never")),
+            (("avg_latency_ms",), lambda m: f"⏱️ Avg Launch: {m['avg_latency_ms']:.0f} ms"),
+            ((), lambda m: "\n📈 Last 7 Days:"),
+            (("history",), lambda m: self.format_history(m["history"])),
+            ((), lambda m: ""),
+            (("language",), lambda m: f"🌍 Current Language: {m['language']}"),
+            (("version",), lambda m: f"⚙️ Current Version: {m['version']}"),
+            (("theme",), lambda m: f"🎨 Current Theme: {m['theme'].title()}"),
+            ((), lambda m: f"\n📁 Game Files Status:\n{separator}"),
+            (("chinese_status",), lambda m: f"🇨🇳 Chinese: {FileManifest.STATUS_TEXT[m['chinese_status']]}"),
+            (("english_status",), lambda m: f"🇺🇸 English: {FileManifest.STATUS_TEXT[m['english_status']]}"),
+            ((), lambda m: system_info),
+        ]
+        self.segments = [None] * len(self.bindings)
+        self.lines = []
+        model.subscribe(self.update)
+    
+    @staticmethod
+    def format_history(history, width=12):
+        """把每日游戏次数格式化为文本柱状图"""
+        peak = max((count for _, count in history), default=0)
+        lines = []
+        for day, count in history:
+            bar = "▇" * (round(count / peak * width) if peak else 0)
+            lines.append(f"{day[5:]} {bar} {count}")
+        return "\n".join(lines)
+    
+    def update(self, changed):
+        """重新生成依赖变化字段的文字段，并把差异写入 Text 组件"""
+        if self.model.get("play_count") is None:
+            return  # 统计在首帧绘制后才载入
+        for i, (fields, render) in enumerate(self.bindings):
+            if self.segments[i] is None or not changed.isdisjoint(fields):
+                self.segments[i] = render(self.model.values)
+        self.write_lines("\n".join(self.segments).split("\n"))
+    
+    def write_lines(self, lines):
+        """只重写内容不同的行，返回重写的行数"""
+        old = self.lines
+        if lines == old:
+            return 0
+        text = self.text
+        text.config(state=tk.NORMAL)
+        rewritten = 0
+        if not old:
+            text.insert("1.0", "\n".join(lines))
+            rewritten = len(lines)
+        else:
+            for i, line in enumerate(lines):
+                if i >= len(old):
+                    text.insert("end-1c", "\n" + line)
+                    rewritten += 1
+                elif old[i] != line:
+                    text.delete(f"{i + 1}.0", f"{i + 1}.end")
+                    text.insert(f"{i + 1}.0", line)
+                    rewritten += 1
+            if len(lines) < len(old):
+                text.delete(f"{len(lines)}.end", "end-1c")
+        text.config(state=tk.DISABLED)
+        self.lines = lines
+        return rewritten
+
+class GameLauncher(tk.Tk):
+    """主游戏启动器类"""
+    def __init__(self, startup_profiler=None, overrides=None):
+        self.startup_profiler = startup_profiler or StartupProfiler()
+        super().__init__()
+        self.startup_profiler.mark("tk init")
+        
+        # 初始化组件
+        self.core = LauncherCore(overrides)
+        self.game_config = self.core.game_config  # 修改变量名避免冲突
+        self.stats = self.core.stats
+        self.manifest = self.core.manifest
+        self.startup_profiler.mark("launcher core")
+        self.theme_manager = ThemeManager()
+        self.animation_handler = AnimationHandler(self)
+        self._manifest_poll_id = None
+        self._watch_id = None
+        self._discovery_poll_id = None
+        self.startup_finished = False
+        self.startup_profiler.mark("services")
+        
+        # 设置窗口
+        self.setup_window()
+        
+        # 创建变量
+        self.language = tk.StringVar(value=self.game_config.get("language", "Chinese"))
+        self.version = tk.StringVar(value=self.game_config.get("version", "v2.0"))
+        self.theme = tk.StringVar(value=self.game_config.get("theme", "dark"))
+        
+        # 界面状态模型：统计面板按行绑定到模型，同一轮事件内的变化合并为一次重绘
+        self.model = ObservableModel(
+            self.after_idle,
+            language=self.language.get(),
+            version=self.version.get(),
+            theme=self.theme.get(),
+            play_count=None,
+        )
+        for name, variable in (("language", self.language), ("version", self.version), ("theme", self.theme)):
+            variable.trace_add("write", lambda *_, name=name, variable=variable: self.model.set(**{name: variable.get()}))
+        
+        # 应用主题
+        self.current_theme = self.theme_manager.activate(self.theme.get())
+        self.apply_theme()
+        self.startup_profiler.mark("setup_window")
+        
+        # 创建界面
+        self.create_widgets()
+        
+        # 绑定关闭事件
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # 统计面板和文件相关的工作推迟到窗口首次绘制（Expose）之后；
+        # 窗口不可见时（例如被最小化启动）由定时器兜底
+        self._expose_binding = self.bind("<Expose>", self.on_first_expose, add="+")
+        self._startup_timer = self.after(1000, self.schedule_startup)
+    
+    def on_first_expose(self, event):
+        """主窗口第一次绘制"""
+        if event.widget is self and self._startup_timer is not None:
+            self.startup_profiler.mark("first paint")
+            self.schedule_startup()
+    
+    def schedule_startup(self):
+        """安排 finish_startup 在本轮事件处理之后执行（只执行一次）"""
+        if self._startup_timer is None:
+            return
+        self.after_cancel(self._startup_timer)
+        self._startup_timer = None
+        self.unbind("<Expose>", self._expose_binding)
+        self.after_idle(self.finish_startup)
+    
+    def finish_startup(self):
+        """首帧绘制后完成延迟的初始化"""
+        profiler = self.startup_profiler
+        self.create_info_panel()
+        profiler.mark("create_info_panel")
+        
+        # 编译过期的游戏页面，然后在后台校验游戏文件
+        self.core.build_games()
+        profiler.mark("build_games")
+        self.load_library()
+        profiler.mark("load_library")
+        self.watch_games()
+        profiler.mark("watch_games")
+        self.update_stats_display()
+        profiler.mark("update_stats_display")
+        self.verify_game_files()
+        profiler.mark("verify_game_files")
+        
+        # 启动动画
+        self.after(100, self.startup_animation)
+        self.startup_finished = True
+        
+        if profiler.enabled:
+            profiler.report()
+    
+    def setup_window(self):
+        """设置窗口属性"""
+        self.title("Super Ball Game Launcher Pro")
+        self.geometry("900x700")
+        self.resizable(True, True)
+        self.minsize(800, 600)
+        
+        # 设置窗口位置
+        pos = self.game_config.get("window_position", {"x": 100, "y": 100})
+        self.geometry(f"900x700+{pos['x']}+{pos['y']}")
+        
+        # 设置图标（如果存在）
+        try:
+            self.iconbitmap("game_icon.ico")
+        except:
+            pass
+    
+    def apply_theme(self):
+        """应用主题"""
+        self.configure(bg=self.current_theme["bg"])
+        self.theme_manager.register(self, bg="bg")
+    
+    def create_widgets(self):
+        """创建所有界面组件"""
+        profiler = self.startup_profiler
+        self.create_header()
+        profiler.mark("create_header")
+        self.create_main_content()
+        self.create_settings_panel()
+        self.create_footer()
+        profiler.mark("create_footer")
+        self.create_menu()
+        profiler.mark("create_menu")
+    
+    def create_header(self):
+        """创建头部区域"""
+        self.header_frame = tk.Frame(self, bg=self.current_theme["bg"], height=120)
+        self.theme_manager.register(self.header_frame, bg="bg")
+        self.header_frame.pack(fill=tk.X, pady=(20, 10))
+        self.header_frame.pack_propagate(False)
+        
+        # 主标题
+        self.title_label = tk.Label(
+            self.header_frame,
+            text="🎮 Super Ball Game Launcher",
+            font=("Helvetica", 28, "bold"),
+            fg=self.current_theme["button_bg"],
+            bg=self.current_theme["bg"]
+        )
+        self.theme_manager.register(self.title_label, fg="button_bg", bg="bg")
+        self.title_label.pack(pady=(20, 5))
+        
+        # 副标题
+        self.subtitle_label = tk.Label(
+            self.header_frame,
+            text="Professional Game Management System",
+            font=("Helvetica", 12, "italic"),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["bg"]
+        )
+        self.theme_manager.register(self.subtitle_label, fg="fg", bg="bg")
+        self.subtitle_label.pack()
+    
+    def create_main_content(self):
+        """创建主要内容区域"""
+        self.main_frame = tk.Frame(self, bg=self.current_theme["bg"])
+        self.theme_manager.register(self.main_frame, bg="bg")
+        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=20)
+        
+        # 左侧面板
+        self.left_panel = tk.Frame(self.main_frame, bg=self.current_theme["frame_bg"], relief=tk.RAISED, bd=2)
+        self.theme_manager.register(self.left_panel, bg="frame_bg")
+        self.left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
+        
+        # 右侧面板
+        # 统计面板在首帧之后才创建，宽度先固定下来，避免布局跳动
+        self.right_panel = tk.Frame(self.main_frame, bg=self.current_theme["frame_bg"], relief=tk.RAISED, bd=2,
+                                    width=274)
+        self.theme_manager.register(self.right_panel, bg="frame_bg")
+        self.right_panel.pack(side=tk.RIGHT, fill=tk.Y, padx=(10, 0))
+        self.right_panel.pack_propagate(False)
+        
+        profiler = self.startup_profiler
+        profiler.mark("create_main_content")
+        self.create_game_selection()
+        profiler.mark("create_game_selection")
+        self.create_action_buttons()
+        profiler.mark("create_action_buttons")
+        self.create_status_panel()
+        profiler.mark("create_status_panel")
+    
+    def create_game_selection(self):
+        """创建游戏选择区域"""
+        # 游戏库：搜索框 + 只绘制可见行的虚拟列表
+        library_frame = tk.LabelFrame(
+            self.left_panel,
+            text="🎮 Game Library",
+            font=("Helvetica", 14, "bold"),
+            fg=self.current_theme["accent"],
+            bg=self.current_theme["frame_bg"],
+            pady=10
+        )
+        self.theme_manager.register(library_frame, fg="accent", bg="frame_bg")
+        library_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
+        
+        search_frame = tk.Frame(library_frame, bg=self.current_theme["frame_bg"])
+        self.theme_manager.register(search_frame, bg="frame_bg")
+        search_frame.pack(fill=tk.X, padx=10, pady=(0, 5))
+        
+        self.library_query = tk.StringVar()
+        self.search_entry = tk.Entry(
+            search_frame,
+            textvariable=self.library_query,
+            font=("Helvetica", 11),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["bg"],
+            insertbackground=self.current_theme["fg"],
+            relief=tk.FLAT
+        )
+        self.theme_manager.register(self.search_entry, fg="fg", bg="bg", insertbackground="fg")
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        self.library_count = tk.Label(
+            search_frame,
+            text="",
+            font=("Helvetica", 10),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["frame_bg"]
+        )
+        self.theme_manager.register(self.library_count, fg="fg", bg="frame_bg")
+        self.library_count.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        self.selected_game = None
+        self.library = VirtualList(
+            library_frame,
+            self.library_rows,
+            rows=6,
+            on_select=self.on_game_select,
+            on_activate=lambda game_id: self.start_game(),
+            bg=self.current_theme["frame_bg"],
+            fg=self.current_theme["fg"],
+            selectbackground=self.current_theme["button_bg"]
+        )
+        self.theme_manager.register(self.library, bg="frame_bg", fg="fg", selectbackground="button_bg")
+        self.library.pack(fill=tk.X, padx=10)
+        # 列表内容在首帧绘制后由 load_library 填充
+        self.library_query.trace_add("write", lambda *_: self.search_library())
+        
+        # 版本选择区域
+        version_frame = tk.LabelFrame(
+            self.left_panel,
+            text="⚙️ Version Selection",
+            font=("Helvetica", 14, "bold"),
+            fg=self.current_theme["accent"],
+            bg=self.current_theme["frame_bg"],
+            pady=10
+        )
+        self.theme_manager.register(version_frame, fg="accent", bg="frame_bg")
+        version_frame.pack(fill=tk.X, padx=20, pady=10)
+        
+        # 版本选项
+        version_options_frame = tk.Frame(version_frame, bg=self.current_theme["frame_bg"])
+        self.theme_manager.register(version_options_frame, bg="frame_bg")
+        version_options_frame.pack(pady=10)
+        
+        self.version_1 = tk.Radiobutton(
+            version_options_frame,
+            text="🎯 v1.0 - Classic Edition",
+            variable=self.version,
+            value="v1.0",
+            font=("Helvetica", 12),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["frame_bg"],
+            selectcolor=self.current_theme["button_bg"],
+            activebackground=self.current_theme["frame_bg"],
+            command=self.on_version_change
+        )
+        self.theme_manager.register(self.version_1, fg="fg", bg="frame_bg", selectcolor="button_bg", activebackground="frame_bg")
+        self.version_1.pack(anchor=tk.W, padx=20, pady=5)
+        
+        self.version_2 = tk.Radiobutton(
+            version_options_frame,
+            text="🚀 v2.0 - Advanced Edition",
+            variable=self.version,
+            value="v2.0",
+            font=("Helvetica", 12),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["frame_bg"],
+            selectcolor=self.current_theme["button_bg"],
+            activebackground=self.current_theme["frame_bg"],
+            command=self.on_version_change
+        )
+        self.theme_manager.register(self.version_2, fg="fg", bg="frame_bg", selectcolor="button_bg", activebackground="frame_bg")
+        self.version_2.pack(anchor=tk.W, padx=20, pady=5)
+        
+        # 特性描述
+        features_frame = tk.Frame(self.left_panel, bg=self.current_theme["frame_bg"])
+        self.theme_manager.register(features_frame, bg="frame_bg")
+        features_frame.pack(fill=tk.X, padx=20, pady=10)
+        
+        self.features_label = tk.Label(
+            features_frame,
+            text=self.get_version_features(),
+            font=("Helvetica", 10),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["frame_bg"],
+            justify=tk.LEFT,
+            wraplength=400
+        )
+        self.theme_manager.register(self.features_label, fg="fg", bg="frame_bg")
+        self.features_label.pack(anchor=tk.W)
+    
+    def create_action_buttons(self):
+        """创建操作按钮"""
+        button_frame = tk.Frame(self.left_panel, bg=self.current_theme["frame_bg"])
+        self.theme_manager.register(button_frame, bg="frame_bg")
+        button_frame.pack(fill=tk.X, padx=20, pady=(20, 10))
+        
+        # 启动游戏按钮
+        self.start_button = CustomButton(
+            button_frame,
+            text="🎮 Start Game",
+            command=self.start_game,
+            font=("Helvetica", 16, "bold"),
+            bg=self.current_theme["button_bg"],
+            fg=self.current_theme["button_fg"],
+            activebackground=self.current_theme["button_active"],
+            width=20,
+            height=2
+        )
+        self.theme_manager.register(self.start_button, bg="button_bg", fg="button_fg", activebackground="button_active")
+        self.start_button.pack(pady=10)
+        
+        # 其他按钮
+        buttons_row = tk.Frame(button_frame, bg=self.current_theme["frame_bg"])
+        self.theme_manager.register(buttons_row, bg="frame_bg")
+        buttons_row.pack(fill=tk.X, pady=10)
+        
+        self.test_button = CustomButton(
+            buttons_row,
+            text="🔧 Test Files",
+            command=self.test_files,
+            font=("Helvetica", 10),
+            bg=self.current_theme["accent"],
+            fg="white",
+            width=12
+        )
+        self.theme_manager.register(self.test_button, bg="accent")
+        self.test_button.pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.settings_button = CustomButton(
+            buttons_row,
+            text="⚙️ Settings",
+            command=self.open_settings,
+            font=("Helvetica", 10),
+            bg="#6c757d",
+            fg="white",
+            width=12
+        )
+        self.settings_button.pack(side=tk.LEFT, padx=5)
+        
+        self.exit_button = CustomButton(
+            buttons_row,
+            text="❌ Exit",
+            command=self.on_closing,
+            font=("Helvetica", 10),
+            bg="#dc3545",
+            fg="white",
+            width=12
+        )
+        self.exit_button.pack(side=tk.LEFT, padx=(5, 0))
+    
+    def create_info_panel(self):
+        """创建统计面板（由 finish_startup 在首帧之后调用）"""
+        info_frame = tk.LabelFrame(
+            self.right_panel,
+            text="📊 Game Statistics",
+            font=("Helvetica", 12, "bold"),
+            fg=self.current_theme["accent"],
+            bg=self.current_theme["frame_bg"],
+            width=250
+        )
+        self.theme_manager.register(info_frame, fg="accent", bg="frame_bg")
+        info_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10, before=self.status_frame)
+        info_frame.pack_propagate(False)
+        
+        # 统计信息
+        self.stats_text = tk.Text(
+            info_frame,
+            font=("Consolas", 9),
+            bg=self.current_theme["bg"],
+            fg=self.current_theme["fg"],
+            wrap=tk.WORD,
+            height=15,
+            state=tk.DISABLED
+        )
+        self.theme_manager.register(self.stats_text, fg="fg", bg="bg")
+        self.stats_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        # 内容由 finish_startup 随后的 update_stats_display 填充
+        self.stats_panel = StatsPanel(self.stats_text, self.model)
+    
+    def create_status_panel(self):
+        """创建状态显示"""
+        self.status_frame = status_frame = tk.LabelFrame(
+            self.right_panel,
+            text="🔄 Status",
+            font=("Helvetica", 12, "bold"),
+            fg=self.current_theme["accent"],
+            bg=self.current_theme["frame_bg"]
+        )
+        self.theme_manager.register(status_frame, fg="accent", bg="frame_bg")
+        status_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
+        self.status_label = tk.Label(
+            status_frame,
+            text="Ready to launch",
+            font=("Helvetica", 10),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["frame_bg"]
+        )
+        self.theme_manager.register(self.status_label, fg="fg", bg="frame_bg")
+        self.status_label.pack(pady=10)
+    
+    def create_settings_panel(self):
+        """创建设置面板"""
+        self.settings_window = None
+    
+    def create_footer(self):
+        """创建底部区域"""
+        self.footer_frame = tk.Frame(self, bg=self.current_theme["frame_bg"], height=40)
+        self.theme_manager.register(self.footer_frame, bg="frame_bg")
+        self.footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
+        self.footer_frame.pack_propagate(False)
+        
+        # 版权信息
+        copyright_label = tk.Label(
+            self.footer_frame,
+            text="© 2025 Super Ball Game Launcher - Professional Edition",
+            font=("Helvetica", 8),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["frame_bg"]
+        )
+        self.theme_manager.register(copyright_label, fg="fg", bg="frame_bg")
+        copyright_label.pack(side=tk.LEFT, padx=20, pady=10)
+        
+        # 时间显示
+        self.time_label = tk.Label(
+            self.footer_frame,
+            text="",
+            font=("Helvetica", 8),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["frame_bg"]
+        )
+        self.theme_manager.register(self.time_label, fg="fg", bg="frame_bg")
+        self.time_label.pack(side=tk.RIGHT, padx=20, pady=10)
+        
+        self.update_time()
+    
+    def create_menu(self):
+        """创建菜单栏"""
+        menubar = tk.Menu(self)
+        self.config(menu=menubar)
+        
+        # 下拉菜单的菜单项在第一次展开时才创建
+        self.add_lazy_menu(menubar, "File", self.fill_file_menu)
+        self.add_lazy_menu(menubar, "Theme", self.fill_theme_menu)
+        self.add_lazy_menu(menubar, "Help", self.fill_help_menu)
+    
+    def add_lazy_menu(self, menubar, label, fill):
+        """添加一个空的下拉菜单，fill(menu) 在它第一次展开前调用"""
+        menu = tk.Menu(menubar, tearoff=0)
+        def post():
+            if menu.index(tk.END) is None:
+                fill(menu)
+        menu.configure(postcommand=post)
+        menubar.add_cascade(label=label, menu=menu)
+    
+    def fill_file_menu(self, file_menu):
+        """文件菜单"""
+        file_menu.add_command(label="Test Game Files", command=self.test_files)
+        file_menu.add_command(label="Browse Game Folder", command=self.browse_folder)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.on_closing)
+    
+    def fill_theme_menu(self, theme_menu):
+        """主题菜单"""
+        theme_menu.add_command(label="Dark Theme", command=lambda: self.change_theme("dark"))
+        theme_menu.add_command(label="Light Theme", command=lambda: self.change_theme("light"))
+        theme_menu.add_command(label="Gaming Theme", command=lambda: self.change_theme("gaming"))
+    
+    def fill_help_menu(self, help_menu):
+        """帮助菜单"""
+        help_menu.add_command(label="About", command=self.show_about)
+        help_menu.add_command(label="Controls", command=self.show_controls)
+    
+    def get_version_features(self):
+        """获取版本特性描述"""
+        features = {
+            "v1.0": "• Basic ball physics\n• Simple controls\n• Classic gameplay\n• Standard graphics",
+            "v2.0": "• Advanced physics engine\n• Spear combat system\n• Enhanced animations\n• Modern graphics\n• Special effects"
+        }
+        return features.get(self.version.get(), "Select a version to see features")
+    
+    def load_library(self):
+        """登记内置游戏并载入游戏库，选中与当前语言和版本对应的条目"""
+        try:
+            self.core.sync_catalog()
+            self.search_library()
+            game_id = self.core.catalog.find(self.core.get_game_path(self.language.get()), self.version.get())
+        except Exception as e:
+            print(f"加载游戏库失败: {e}")
+            return
+        if game_id is not None:
+            self.library.select(game_id, notify=False)
+            self.selected_game = self.core.catalog.get(game_id)
+    
+    def search_library(self):
+        """按搜索框内容（词前缀和 #标签）刷新游戏库列表"""
+        game_ids = self.core.catalog.search(self.library_query.get())
+        self.library.set_keys(game_ids)
+        self.library_count.config(text=f"{len(game_ids)} games")
+    
+    def library_rows(self, game_ids):
+        """虚拟列表按需读取可见行"""
+        entries = self.core.catalog.get_many(game_ids)
+        return {
+            game_id: f"{entry['title']}  ·  {entry['language']} {entry['version']}  ·  {entry['play_count']} plays"
+            for game_id, entry in entries.items()
+        }
+    
+    def on_game_select(self, game_id):
+        """游戏库选中回调：同步语言和版本"""
+        entry = self.core.catalog.get(game_id)
+        if entry is None:
+            return
+        self.selected_game = entry
+        if entry["language"] and entry["language"] != self.language.get():
+            self.language.set(entry["language"])
+            self.on_language_change()
+        if entry["version"] in ("v1.0", "v2.0") and entry["version"] != self.version.get():
+            self.version.set(entry["version"])
+            self.on_version_change()
+    
+    def on_language_change(self):
+        """语言变更回调"""
+        self.game_config.set("language", self.language.get())
+        self.update_status(f"Language changed to {self.language.get()}")
+    
+    def on_version_change(self):
+        """版本变更回调"""
+        self.game_config.set("version", self.version.get())
+        # 游戏库中选中同一页面的对应版本
+        if self.selected_game is not None and self.selected_game["version"] != self.version.get():
+            game_id = self.core.catalog.find(self.selected_game["path"], self.version.get())
+            if game_id is not None:
+                self.library.select(game_id, notify=False)
+                self.selected_game = self.core.catalog.get(game_id)
+        self.features_label.config(text=self.get_version_features())
+        self.update_status(f"Version changed to {self.version.get()}")
+    
+    def change_theme(self, theme_name):
+        """更改主题"""
+        self.theme.set(theme_name)
+        self.game_config.set("theme", theme_name)
+        self.refresh_ui()
+        self.update_status(f"Theme changed to {theme_name}")
+    
+    def refresh_ui(self):
+        """刷新界面"""
+        # 原地重新着色已登记的组件，不重建组件树
+        self.animation_handler.cancel_all()
+        self.current_theme = self.theme_manager.apply(self.theme.get())
+        self.update_stats_display()
+    
+    def update_status(self, message):
+        """更新状态显示"""
+        self.status_label.config(text=message)
+        self.after(3000, lambda: self.status_label.config(text="Ready to launch"))
+    
+    def update_stats_display(self):
+        """把最新的统计和文件状态写入模型（面板在空闲时只重绘变化的行）"""
+        self.model.set(
+            chinese_status=self.core.file_status("chinese"),
+            english_status=self.core.file_status("english"),
+            **self.stats.get_stats()
+        )
+    
+    def update_time(self):
+        """更新时间显示"""
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.time_label.config(text=current_time)
+        self.after(1000, self.update_time)
+    
+    def verify_game_files(self, callback=None):
+        """在后台校验所有游戏文件，完成后刷新统计面板"""
+        paths = [self.core.get_game_path("chinese"), self.core.get_game_path("english")]
+        self.manifest.verify_async(paths, callback)
+        if self._manifest_poll_id is None:
+            self._manifest_poll_id = self.after(50, self.poll_file_checks)
+    
+    def poll_file_checks(self):
+        """在Tk线程中取回后台校验结果"""
+        self._manifest_poll_id = None
+        if self.manifest.deliver():
+            self.update_stats_display()
+        if self.manifest.pending:
+            self._manifest_poll_id = self.after(50, self.poll_file_checks)
+    
+    def test_files(self):
+        """测试游戏文件"""
+        self.update_status("Verifying game files...")
+        self.verify_game_files(self.show_file_test_results)
+    
+    def show_file_test_results(self, results):
+        """显示文件校验结果"""
+        from tkinter import messagebox
+        chinese_status = self.core.file_status("chinese")
+        english_status = self.core.file_status("english")
+        
+        result = "File Test Results:\n\n"
+        result += f"Chinese Version: {FileManifest.STATUS_TEXT[chinese_status]}\n"
+        result += f"English Version: {FileManifest.STATUS_TEXT[english_status]}\n\n"
+        
+        if chinese_status != "ok":
+            result += f"Chinese file path: {self.core.get_game_path('chinese')}\n"
+        if english_status != "ok":
+            result += f"English file path: {self.core.get_game_path('english')}\n"
+        
+        messagebox.showinfo("File Test", result)
+    
+    def browse_folder(self):
+        """添加游戏文件夹（递归扫描其中的游戏页面）"""
+        from tkinter import filedialog
+        folder_path = filedialog.askdirectory(title="Select Game Folder")
+        if folder_path:
+            if self.core.add_game_root(folder_path):
+                self.update_status(f"Scanning {folder_path}...")
+            self.watch_games()
+    
+    def watch_games(self):
+        """在后台增量扫描游戏目录并检查配置文件，按 watch_interval_ms 定时重复（为 0 时只执行一次）"""
+        if self._watch_id is not None:
+            self.after_cancel(self._watch_id)
+            self._watch_id = None
+        if self.game_config.reload():
+            self.on_config_reloaded()
+        if self.core.discovery.scan_async(self.on_games_scanned) and self._discovery_poll_id is None:
+            self._discovery_poll_id = self.after(50, self.poll_discovery)
+        interval = self.game_config.get("watch_interval_ms", 3000)
+        if interval:
+            self._watch_id = self.after(interval, self.watch_games)
+    
+    def on_config_reloaded(self):
+        """配置文件在外部被修改：界面跟随新的语言、版本和主题"""
+        for variable, key in ((self.language, "language"), (self.version, "version")):
+            value = self.game_config.get(key)
+            if value != variable.get():
+                variable.set(value)
+        theme = self.game_config.get("theme")
+        if theme != self.theme.get():
+            self.theme.set(theme)
+            self.refresh_ui()
+        self.features_label.config(text=self.get_version_features())
+    
+    def poll_discovery(self):
+        """在Tk线程中取回后台扫描结果"""
+        self._discovery_poll_id = None
+        if not self.core.discovery.deliver():
+            self._discovery_poll_id = self.after(50, self.poll_discovery)
+    
+    def on_games_scanned(self, result):
+        """扫描完成：有变化时更新游戏库并复查游戏文件"""
+        if not (result["added"] or result["removed"] or result["changed"]):
+            return
+        self.core.sync_discovered()
+        self.library.invalidate()
+        self.search_library()
+        if result["changed"] or result["removed"]:
+            self.verify_game_files()
+    
+    def open_settings(self):
+        """打开设置窗口"""
+        if self.settings_window and self.settings_window.winfo_exists():
+            self.settings_window.lift()
+            return
+        
+        self.settings_window = tk.Toplevel(self)
+        self.settings_window.title("Settings")
+        self.settings_window.geometry("400x300")
+        self.settings_window.configure(bg=self.current_theme["bg"])
+        self.theme_manager.register(self.settings_window, bg="bg")
+        
+        # 设置内容
+        settings_label = tk.Label(
+            self.settings_window,
+            text="⚙️ Game Settings",
+            font=("Helvetica", 16, "bold"),
+            fg=self.current_theme["button_bg"],
+            bg=self.current_theme["bg"]
+        )
+        self.theme_manager.register(settings_label, fg="button_bg", bg="bg")
+        settings_label.pack(pady=20)
+        
+        # 自动启动选项
+        auto_frame = tk.Frame(self.settings_window, bg=self.current_theme["bg"])
+        self.theme_manager.register(auto_frame, bg="bg")
+        auto_frame.pack(pady=10)
+        
+        self.auto_launch_var = tk.BooleanVar(value=self.game_config.get("auto_launch", False))
+        auto_check = tk.Checkbutton(
+            auto_frame,
+            text="Auto-launch last selected game",
+            variable=self.auto_launch_var,
+            font=("Helvetica", 12),
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["bg"],
+            selectcolor=self.current_theme["button_bg"],
+            command=self.save_auto_launch
+        )
+        self.theme_manager.register(auto_check, fg="fg", bg="bg", selectcolor="button_bg")
+        auto_check.pack()
+        
+        # 路径设置
+        path_frame = tk.LabelFrame(
+            self.settings_window,
+            text="Game Paths",
+            font=("Helvetica", 12, "bold"),
+            fg=self.current_theme["accent"],
+            bg=self.current_theme["bg"]
+        )
+        self.theme_manager.register(path_frame, fg="accent", bg="bg")
+        path_frame.pack(fill=tk.X, padx=20, pady=20)
+        
+        # 中文路径
+        chinese_label = tk.Label(path_frame, text="Chinese Version:", fg=self.current_theme["fg"], bg=self.current_theme["bg"])
+        self.theme_manager.register(chinese_label, fg="fg", bg="bg")
+        chinese_label.pack(anchor=tk.W, padx=10, pady=(10, 0))
+        
+        chinese_path_label = tk.Label(
+            path_frame,
+            text=self.game_config.get("chinese_path", "")[:50] + "...",
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["bg"],
+            font=("Helvetica", 8)
+        )
+        self.theme_manager.register(chinese_path_label, fg="fg", bg="bg")
+        chinese_path_label.pack(anchor=tk.W, padx=10)
+        
+        # 英文路径
+        english_label = tk.Label(path_frame, text="English Version:", fg=self.current_theme["fg"], bg=self.current_theme["bg"])
+        self.theme_manager.register(english_label, fg="fg", bg="bg")
+        english_label.pack(anchor=tk.W, padx=10, pady=(10, 0))
+        
+        english_path_label = tk.Label(
+            path_frame,
+            text=self.game_config.get("english_path", "")[:50] + "...",
+            fg=self.current_theme["fg"],
+            bg=self.current_theme["bg"],
+            font=("Helvetica", 8)
+        )
+        self.theme_manager.register(english_path_label, fg="fg", bg="bg")
+        english_path_label.pack(anchor=tk.W, padx=10, pady=(0, 10))
+    
+    def save_auto_launch(self):
+        """保存自动启动设置"""
+        self.game_config.set("auto_launch", self.auto_launch_var.get())
+    
+    def show_about(self):
+        """显示关于信息"""
+        from tkinter import messagebox
+        about_text = """
+Super Ball Game Launcher Pro v1.0
+
+A professional game management system for the Super Ball game series.
+
+Features:
+• Multi-language support
+• Version management  
+• Theme customization
+• Game statistics
+• File validation
+• Auto-launch options
+
+© 2025 Game Development Team
+        """
+        messagebox.showinfo("About", about_text)
+    
+    def show_controls(self):
+        """显示控制说明"""
+        from tkinter import messagebox
+        controls_text = """
+Game Controls:
+
+🎮 In-Game Controls:
+• W - Jump
+• A - Move Left  
+• D - Move Right
+• Space - Attack/Shoot
+• R - Restart Game
+
+🖱️ Launcher Controls:
+• Select language and version
+• Click Start Game to launch
+• Use menu for advanced options
+• Check statistics in right panel
+        """
+        messagebox.showinfo("Game Controls", controls_text)
+    
+    def startup_animation(self):
+        """启动动画"""
+        self.animation_handler.fade_in(self.title_label)
+        self.after(500, lambda: self.animation_handler.fade_in(self.subtitle_label))
+    
+    def start_game(self):
+        """启动游戏"""
+        launch_start = time.perf_counter()
+        from tkinter import messagebox
+        lang = self.language.get()
+        version = self.version.get()
+        
+        # 确定文件路径并读取校验结论（模板有改动时先重新编译）
+        game_path = self.selected_game["path"] if self.selected_game else None
+        file_path, status = self.core.prepare_launch(lang, game_path)
+        
+        if status not in ("ok", "modified"):
+            messagebox.showerror(
+                "Error",
+                f"Game file not found:\n{file_path}\n\nPlease check the file path in settings."
+            )
+            return
+        
+        if status == "modified":
+            if not messagebox.askyesno(
+                "Warning",
+                f"Game file has changed since it was last verified:\n{file_path}\n\nLaunch anyway?"
+            ):
+                return
+            self.manifest.accept(file_path)
+        
+        try:
+            # 启动游戏并记录本次会话
+            launch = self.core.open_game(lang, version, file_path, launch_start)
+            
+            # 更新界面（后台复查文件，结果返回后再次刷新）
+            self.update_stats_display()
+            self.verify_game_files()
+            if self.selected_game is not None:
+                self.library.invalidate([self.selected_game["id"]])
+            if launch["method"] == "reuse":
+                self.update_status(f"Game already running: {lang} {version}")
+            else:
+                self.update_status(f"Game launched: {lang} {version} ({launch['total_ms']:.0f} ms)")
+            
+            # 播放启动动画
+            self.animation_handler.bounce_effect(self.start_button)
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to launch game:\n{str(e)}")
+    
+    def on_closing(self):
+        """关闭程序"""
+        from tkinter import messagebox
+        # 保存窗口位置
+        geometry = self.geometry()
+        x = self.winfo_x()
+        y = self.winfo_y()
+        self.game_config.set("window_position", {"x": x, "y": y})
+        
+        # 确认退出
+        if messagebox.askokcancel("Exit", "Are you sure you want to exit?"):
+            self.core.shutdown()
+            self.destroy()
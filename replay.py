@@ -0,0 +1,218 @@
+"""Super Ball 回放校验
+
+读取游戏导出的二进制回放（游戏中按 V 保存，.sbr 文件），用 superball_engine 按
+相同的种子和逐帧按键重新模拟，核对最终状态。可以一次校验整个目录的回放。
+
+回放格式（小端）:
+    头部 60 字节: 魔数 b"SBRP"、格式版本、种子、帧数、反弹次数、生命值、标志
+                  （bit0 = 游戏结束）、球和火柴人的最终坐标（4 个 float64）、游程数
+    之后每个游程: 按键位掩码 (uint8) + 持续帧数 (LEB128 变长整数)
+
+浏览器和 Python 的 sin/cos/atan2 可能有最后一位的差异，所以坐标按容差比较，
+帧数、反弹次数、生命值和是否结束必须完全一致。
+
+示例:
+    python replay.py superball-replay-123456.sbr
+    python replay.py replays/ --json
+"""
+import argparse
+import json
+import os
+import struct
+import sys
+
+import superball_engine as engine
+
+MAGIC = b"SBRP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sB3xIIIBB2x4dI")
+FLAG_GAME_OVER = 1
+
+class ReplayError(Exception):
+    """回放文件格式有误"""
+
+def encode_varint(value):
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+def read_varint(data, offset):
+    """读取 LEB128 变长整数，返回 (值, 新偏移)"""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayError("游程数据被截断")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+def encode(replay):
+    """把回放字典编码为二进制"""
+    parts = [HEADER.pack(
+        MAGIC, FORMAT_VERSION, replay["seed"], replay["ticks"], replay["bounces"],
+        replay["health"], FLAG_GAME_OVER if replay["game_over"] else 0,
+        *replay["ball"], *replay["player"], len(replay["runs"]),
+    )]
+    for keys, length in replay["runs"]:
+        parts.append(bytes([keys]))
+        parts.append(encode_varint(length))
+    return b"".join(parts)
+
+def decode(data):
+    """解析二进制回放"""
+    if len(data) < HEADER.size:
+        raise ReplayError("文件过短")
+    (magic, version, seed, ticks, bounces, health, flags,
+     ball_x, ball_y, player_x, player_y, run_count) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ReplayError("不是 Super Ball 回放文件")
+    if version != FORMAT_VERSION:
+        raise ReplayError(f"不支持的回放格式版本: {version}")
+
+    runs = []
+    offset = HEADER.size
+    for _ in range(run_count):
+        if offset >= len(data):
+            raise ReplayError("游程数据被截断")
+        keys = data[offset]
+        length, offset = read_varint(data, offset + 1)
+        runs.append((keys, length))
+    if sum(length for _, length in runs) != ticks:
+        raise ReplayError("游程总帧数与头部不符")
+    return {
+        "seed": seed,
+        "ticks": ticks,
+        "bounces": bounces,
+        "health": health,
+        "game_over": bool(flags & FLAG_GAME_OVER),
+        "ball": (ball_x, ball_y),
+        "player": (player_x, player_y),
+        "runs": runs,
+    }
+
+def load(path):
+    with open(path, 'rb') as f:
+        return decode(f.read())
+
+def expand(runs):
+    """把游程展开为逐帧按键"""
+    for keys, length in runs:
+        for _ in range(length):
+            yield keys
+
+def compress(inputs):
+    """把逐帧按键压缩为游程"""
+    runs = []
+    for keys in inputs:
+        if runs and runs[-1][0] == keys:
+            runs[-1][1] += 1
+        else:
+            runs.append([keys, 1])
+    return [tuple(run) for run in runs]
+
+def final_state(game, seed, ticks, runs):
+    """把模拟结束时的状态整理成回放字典"""
+    return {
+        "seed": seed,
+        "ticks": ticks,
+        "bounces": game.bounces,
+        "health": max(0, game.health),
+        "game_over": game.game_over,
+        "ball": (game.ball_x, game.ball_y),
+        "player": (game.player_x, game.player_y),
+        "runs": runs,
+    }
+
+def simulate(replay, params=None):
+    """按回放的种子和按键重新模拟，返回模拟得到的回放字典"""
+    game = engine.ScalarGame(params, seed=replay["seed"])
+    ticks = 0
+    for keys in expand(replay["runs"]):
+        if game.game_over:
+            break
+        game.step(keys)
+        ticks += 1
+    return final_state(game, replay["seed"], ticks, replay["runs"])
+
+def record(seed, inputs, params=None):
+    """在 Python 中录制一局回放（用于生成样例和测试）"""
+    game = engine.ScalarGame(params, seed=seed)
+    played = []
+    for keys in inputs:
+        if game.game_over:
+            break
+        game.step(keys)
+        played.append(keys)
+    return final_state(game, seed, len(played), compress(played))
+
+def verify(replay, tolerance=1e-6, params=None):
+    """校验回放记录的最终状态，返回 (是否一致, 不一致的字段列表)"""
+    expected = simulate(replay, params)
+    mismatches = []
+    for field in ("ticks", "bounces", "health", "game_over"):
+        if replay[field] != expected[field]:
+            mismatches.append(f"{field}: recorded {replay[field]}, simulated {expected[field]}")
+    for field in ("ball", "player"):
+        recorded, simulated = replay[field], expected[field]
+        if any(abs(a - b) > tolerance for a, b in zip(recorded, simulated)):
+            mismatches.append(
+                f"{field}: recorded ({recorded[0]:.6f}, {recorded[1]:.6f}), "
+                f"simulated ({simulated[0]:.6f}, {simulated[1]:.6f})"
+            )
+    return not mismatches, mismatches
+
+def collect(paths):
+    """展开命令行给出的文件和目录"""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".sbr"):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify Super Ball replays against the Python engine")
+    parser.add_argument("paths", nargs="+", help="回放文件或包含 .sbr 文件的目录")
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="坐标允许的误差")
+    parser.add_argument("--json", action="store_true", help="以JSON输出")
+    args = parser.parse_args(argv)
+
+    results = []
+    for path in collect(args.paths):
+        try:
+            replay = load(path)
+        except (OSError, ReplayError, struct.error) as e:
+            results.append({"path": path, "ok": False, "errors": [f"读取回放失败: {e}"]})
+            continue
+        ok, mismatches = verify(replay, args.tolerance)
+        results.append({
+            "path": path, "ok": ok, "errors": mismatches, "seed": replay["seed"],
+            "ticks": replay["ticks"], "bounces": replay["bounces"],
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=4, ensure_ascii=False))
+    else:
+        for result in results:
+            if result["ok"]:
+                print(f"OK    {result['path']}  seed {result['seed']}  "
+                      f"{result['ticks']} ticks ({result['ticks'] * engine.TICK_MS / 1000:.1f}s)  "
+                      f"{result['bounces']} bounces")
+            else:
+                print(f"FAIL  {result['path']}")
+                for error in result["errors"]:
+                    print(f"      {error}")
+        failed = sum(1 for result in results if not result["ok"])
+        print(f"{len(results) - failed}/{len(results)} replays verified")
+    return 0 if results and all(result["ok"] for result in results) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,513 @@
+"""Super Ball 无界面物理引擎
+
+按 HTML 版本中 Ball / StickMan / checkCollision 的规则逐帧模拟（每帧 30 毫秒），
+不依赖浏览器。提供两种实现：
+    ScalarGame  - 纯 Python 的单局参考实现
+    VectorGames - 基于 NumPy 结构数组，一次推进成千上万局独立游戏
+两者使用同一个可播种的 mulberry32 随机数生成器，按相同顺序取随机数，
+可以用 check_equivalence() 相互校验。
+"""
+import math
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 每帧按键位掩码
+KEY_JUMP = 1      # W
+KEY_LEFT = 2      # A
+KEY_RIGHT = 4     # D
+KEY_ATTACK = 8    # 空格
+
+# 每帧时长（毫秒），与 HTML 中的 TICK_MS 一致；速度和计时都按帧计，改动会改变游戏速度
+TICK_MS = 30
+TICKS_PER_SECOND = 1000 / TICK_MS
+
+# 默认参数，与 HTML 中的常量一一对应
+DEFAULT_PARAMS = {
+    "width": 800,
+    "height": 600,
+    # Ball
+    "ball_radius": 15,
+    "base_speed": 12.0,
+    "max_speed": 30.0,
+    "speed_increment": 1.5,
+    "max_health": 3,
+    "stun_duration": 30,
+    "slow_duration": 150,
+    "slow_factor": 0.3,
+    "bounce_spread": math.pi / 3,
+    # StickMan
+    "player_radius": 20,
+    "player_start_x": 100.0,
+    "player_start_y": 500.0,
+    "attack_cooldown": 20,
+    "attack_duration": 15,
+    "attack_range": 80.0,
+    "acceleration": 1.8,
+    "friction": 0.85,
+    "gravity": 0.6,
+    "jump_power": -15.0,
+    "ground_y": 570.0,
+    "max_run_speed": 30.0,
+    "wall_margin": 30.0,
+    # 全局
+    "invulnerable_time": 60,
+}
+
+def make_params(overrides=None):
+    """合并默认参数，拒绝未知参数名"""
+    params = dict(DEFAULT_PARAMS)
+    for key, value in (overrides or {}).items():
+        if key not in params:
+            raise KeyError(f"未知参数: {key}")
+        params[key] = value
+    return params
+
+class Mulberry32:
+    """mulberry32 伪随机数生成器（与 JS 版本逐位一致）"""
+    def __init__(self, seed):
+        self.state = seed & 0xFFFFFFFF
+
+    def random(self):
+        """返回 [0, 1) 之间的浮点数"""
+        self.state = (self.state + 0x6D2B79F5) & 0xFFFFFFFF
+        a = self.state
+        t = ((a ^ (a >> 15)) * (1 | a)) & 0xFFFFFFFF
+        t = ((t + (((t ^ (t >> 7)) * (61 | t)) & 0xFFFFFFFF)) & 0xFFFFFFFF) ^ t
+        return ((t ^ (t >> 14)) & 0xFFFFFFFF) / 4294967296
+
+class ScalarGame:
+    """单局游戏的参考实现，逐行对应 HTML 中的游戏循环"""
+    def __init__(self, params=None, seed=0):
+        self.params = make_params(params)
+        self.rng = Mulberry32(seed)
+        self.reset()
+
+    def reset(self):
+        """对应 restartGame()"""
+        p = self.params
+        # Ball
+        self.ball_x = p["width"] / 2
+        self.ball_y = p["height"] / 2
+        self.speed = p["base_speed"]
+        self.health = p["max_health"]
+        self.slow = 0
+        self.stun = 0
+        self.pending_slow = False
+        angle = self.rng.random() * math.pi * 2
+        self.ball_vx = math.cos(angle) * self.speed
+        self.ball_vy = math.sin(angle) * self.speed
+        self.bounces = 0
+        # StickMan
+        self.player_x = p["player_start_x"]
+        self.player_y = p["player_start_y"]
+        self.player_vx = 0.0
+        self.player_vy = 0.0
+        self.on_ground = True
+        self.attack_cooldown = 0
+        self.attack_animation = 0
+        self.attacking = False
+        self.hits = 0
+        # 全局
+        self.invulnerable = 0
+        self.game_over = False
+        self.ticks = 0
+
+    def step(self, keys):
+        """推进一帧，keys 为 KEY_* 位掩码"""
+        if self.game_over:
+            return
+        self.ticks += 1
+        self._handle_input(keys)
+        if self.invulnerable > 0:
+            self.invulnerable -= 1
+        self._move_ball()
+        self._move_player()
+        self._check_collision()
+
+    def run(self, inputs):
+        """依次执行一组按键输入，返回是否仍存活"""
+        for keys in inputs:
+            if self.game_over:
+                break
+            self.step(keys)
+        return not self.game_over
+
+    def _handle_input(self, keys):
+        """对应 handleInput()"""
+        p = self.params
+        if keys & KEY_JUMP and self.on_ground:
+            self.player_vy = p["jump_power"]
+            self.on_ground = False
+        if keys & KEY_LEFT:
+            self.player_vx = max(self.player_vx - p["acceleration"], -p["max_run_speed"])
+        if keys & KEY_RIGHT:
+            self.player_vx = min(self.player_vx + p["acceleration"], p["max_run_speed"])
+        if keys & KEY_ATTACK and self.attack_cooldown <= 0:
+            self.attacking = True
+            self.attack_animation = p["attack_duration"]
+            self.attack_cooldown = p["attack_cooldown"]
+            dx = self.player_x - self.ball_x
+            dy = self.player_y - self.ball_y
+            if math.sqrt(dx * dx + dy * dy) <= p["attack_range"]:
+                # 对应 getHitBySpear()：眩晕结束后才切换到减速速度
+                self.stun = p["stun_duration"]
+                self.slow = p["slow_duration"]
+                self.pending_slow = True
+                self.hits += 1
+
+    def _set_velocity(self, magnitude):
+        angle = math.atan2(self.ball_vy, self.ball_vx)
+        self.ball_vx = math.cos(angle) * magnitude
+        self.ball_vy = math.sin(angle) * magnitude
+
+    def _bounce(self):
+        p = self.params
+        angle = math.atan2(self.ball_vy, self.ball_vx) + (self.rng.random() - 0.5) * p["bounce_spread"]
+        magnitude = self.speed * p["slow_factor"] if self.slow > 0 else self.speed
+        self.ball_vx = math.cos(angle) * magnitude
+        self.ball_vy = math.sin(angle) * magnitude
+
+    def _move_ball(self):
+        """对应 Ball.prototype.move()"""
+        p = self.params
+        if self.stun > 0:
+            self.stun -= 1
+            return
+        if self.pending_slow:
+            self.pending_slow = False
+            if self.slow > 0:
+                self._set_velocity(self.speed * p["slow_factor"])
+        if self.slow > 0:
+            self.slow -= 1
+            if self.slow <= 0:
+                self._set_velocity(self.speed)
+
+        self.ball_x += self.ball_vx
+        self.ball_y += self.ball_vy
+        radius = p["ball_radius"]
+        bounced = False
+
+        if self.ball_x - radius <= 0 or self.ball_x + radius >= p["width"]:
+            self.ball_x = radius if self.ball_x - radius <= 0 else p["width"] - radius
+            bounced = True
+            self.ball_vx = -self.ball_vx
+            self._bounce()
+
+        if self.ball_y - radius <= 0 or self.ball_y + radius >= p["height"]:
+            self.ball_y = radius if self.ball_y - radius <= 0 else p["height"] - radius
+            bounced = True
+            self.ball_vy = -self.ball_vy
+            self._bounce()
+
+        if bounced:
+            if self.speed < p["max_speed"]:
+                self.speed = min(self.speed + p["speed_increment"], p["max_speed"])
+            self.bounces += 1
+
+    def _move_player(self):
+        """对应 StickMan.prototype.move()"""
+        p = self.params
+        if self.attack_cooldown > 0:
+            self.attack_cooldown -= 1
+        if self.attack_animation > 0:
+            self.attack_animation -= 1
+            if self.attack_animation <= 0:
+                self.attacking = False
+
+        if not self.on_ground:
+            self.player_vy += p["gravity"]
+        self.player_vx *= p["friction"]
+        if abs(self.player_vx) < 0.1:
+            self.player_vx = 0.0
+
+        self.player_x += self.player_vx
+        self.player_y += self.player_vy
+
+        if self.player_y >= p["ground_y"]:
+            self.player_y = p["ground_y"]
+            self.player_vy = 0.0
+            self.on_ground = True
+        else:
+            self.on_ground = False
+
+        if self.player_x < p["wall_margin"]:
+            self.player_x = p["wall_margin"]
+            self.player_vx = 0.0
+        if self.player_x > p["width"] - p["wall_margin"]:
+            self.player_x = p["width"] - p["wall_margin"]
+            self.player_vx = 0.0
+
+    def _check_collision(self):
+        """对应 checkCollision() / takeDamage()"""
+        p = self.params
+        if self.invulnerable > 0:
+            return
+        dx = self.ball_x - self.player_x
+        dy = self.ball_y - self.player_y
+        if math.sqrt(dx * dx + dy * dy) < p["ball_radius"] + p["player_radius"]:
+            self.health -= 1
+            self.invulnerable = p["invulnerable_time"]
+            if self.health <= 0:
+                self.game_over = True
+
+class VectorGames:
+    """NumPy 结构数组实现：每个字段一个数组，每局游戏占一个下标"""
+    FIELDS = (
+        "ball_x", "ball_y", "ball_vx", "ball_vy", "speed",
+        "player_x", "player_y", "player_vx", "player_vy",
+    )
+
+    def __init__(self, count, params=None, seeds=None):
+        if np is None:
+            raise RuntimeError("VectorGames 需要 NumPy: pip install numpy")
+        self.count = count
+        self.params = make_params(params)
+        if seeds is None:
+            seeds = np.arange(count)
+        self.rng_state = np.asarray(seeds, dtype=np.int64).astype(np.uint32)
+        self.reset()
+
+    def reset(self):
+        """所有游戏回到初始状态（随机数状态继续推进）"""
+        p = self.params
+        n = self.count
+        self.ball_x = np.full(n, p["width"] / 2, dtype=np.float64)
+        self.ball_y = np.full(n, p["height"] / 2, dtype=np.float64)
+        self.speed = np.full(n, float(p["base_speed"]))
+        self.health = np.full(n, p["max_health"], dtype=np.int32)
+        self.slow = np.zeros(n, dtype=np.int32)
+        self.stun = np.zeros(n, dtype=np.int32)
+        self.pending_slow = np.zeros(n, dtype=bool)
+        angle = self._random(np.ones(n, dtype=bool)) * math.pi * 2
+        self.ball_vx = np.cos(angle) * self.speed
+        self.ball_vy = np.sin(angle) * self.speed
+        self.bounces = np.zeros(n, dtype=np.int32)
+
+        self.player_x = np.full(n, float(p["player_start_x"]))
+        self.player_y = np.full(n, float(p["player_start_y"]))
+        self.player_vx = np.zeros(n)
+        self.player_vy = np.zeros(n)
+        self.on_ground = np.ones(n, dtype=bool)
+        self.attack_cooldown = np.zeros(n, dtype=np.int32)
+        self.attack_animation = np.zeros(n, dtype=np.int32)
+        self.attacking = np.zeros(n, dtype=bool)
+        self.hits = np.zeros(n, dtype=np.int32)
+
+        self.invulnerable = np.zeros(n, dtype=np.int32)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.ticks = np.zeros(n, dtype=np.int32)
+
+    def _random(self, mask):
+        """为 mask 选中的游戏各取一个随机数（逐局独立的 mulberry32）"""
+        idx = np.flatnonzero(mask)
+        a = self.rng_state[idx] + np.uint32(0x6D2B79F5)
+        self.rng_state[idx] = a
+        t = (a ^ (a >> np.uint32(15))) * (a | np.uint32(1))
+        t = (t + (t ^ (t >> np.uint32(7))) * (t | np.uint32(61))) ^ t
+        values = np.zeros(self.count)
+        values[idx] = (t ^ (t >> np.uint32(14))) / 4294967296.0
+        return values
+
+    def step(self, keys):
+        """所有未结束的游戏推进一帧，keys 为标量或逐局位掩码数组"""
+        alive = ~self.game_over
+        if not alive.any():
+            return
+        keys = np.broadcast_to(np.asarray(keys, dtype=np.int32), (self.count,))
+        self.ticks += alive
+        self._handle_input(keys, alive)
+        np.subtract(self.invulnerable, 1, out=self.invulnerable, where=alive & (self.invulnerable > 0))
+        self._move_ball(alive)
+        self._move_player(alive)
+        self._check_collision(alive)
+
+    def run(self, policy, max_ticks):
+        """用 policy(games) -> 按键数组 驱动，直到全部结束或达到 max_ticks"""
+        for _ in range(max_ticks):
+            if self.game_over.all():
+                break
+            self.step(policy(self))
+        return self.ticks
+
+    def _handle_input(self, keys, alive):
+        p = self.params
+        jump = alive & (keys & KEY_JUMP != 0) & self.on_ground
+        self.player_vy[jump] = p["jump_power"]
+        self.on_ground[jump] = False
+
+        left = alive & (keys & KEY_LEFT != 0)
+        self.player_vx = np.where(left, np.maximum(self.player_vx - p["acceleration"], -p["max_run_speed"]), self.player_vx)
+        right = alive & (keys & KEY_RIGHT != 0)
+        self.player_vx = np.where(right, np.minimum(self.player_vx + p["acceleration"], p["max_run_speed"]), self.player_vx)
+
+        attack = alive & (keys & KEY_ATTACK != 0) & (self.attack_cooldown <= 0)
+        if attack.any():
+            self.attacking |= attack
+            self.attack_animation[attack] = p["attack_duration"]
+            self.attack_cooldown[attack] = p["attack_cooldown"]
+            dx = self.player_x - self.ball_x
+            dy = self.player_y - self.ball_y
+            hit = attack & (np.sqrt(dx * dx + dy * dy) <= p["attack_range"])
+            self.stun[hit] = p["stun_duration"]
+            self.slow[hit] = p["slow_duration"]
+            self.pending_slow |= hit
+            self.hits += hit
+
+    def _set_velocity(self, mask, magnitude):
+        angle = np.arctan2(self.ball_vy, self.ball_vx)
+        self.ball_vx = np.where(mask, np.cos(angle) * magnitude, self.ball_vx)
+        self.ball_vy = np.where(mask, np.sin(angle) * magnitude, self.ball_vy)
+
+    def _bounce(self, mask):
+        p = self.params
+        spread = (self._random(mask) - 0.5) * p["bounce_spread"]
+        angle = np.arctan2(self.ball_vy, self.ball_vx) + spread
+        magnitude = np.where(self.slow > 0, self.speed * p["slow_factor"], self.speed)
+        self.ball_vx = np.where(mask, np.cos(angle) * magnitude, self.ball_vx)
+        self.ball_vy = np.where(mask, np.sin(angle) * magnitude, self.ball_vy)
+
+    def _move_ball(self, alive):
+        p = self.params
+        stunned = alive & (self.stun > 0)
+        self.stun -= stunned
+        moving = alive & ~stunned
+
+        slow_start = moving & self.pending_slow
+        self.pending_slow &= ~moving
+        slow_start &= self.slow > 0
+        if slow_start.any():
+            self._set_velocity(slow_start, self.speed * p["slow_factor"])
+
+        slowed = moving & (self.slow > 0)
+        self.slow -= slowed
+        restore = slowed & (self.slow <= 0)
+        if restore.any():
+            self._set_velocity(restore, self.speed)
+
+        self.ball_x = np.where(moving, self.ball_x + self.ball_vx, self.ball_x)
+        self.ball_y = np.where(moving, self.ball_y + self.ball_vy, self.ball_y)
+        radius = p["ball_radius"]
+
+        low = self.ball_x - radius <= 0
+        vertical = moving & (low | (self.ball_x + radius >= p["width"]))
+        if vertical.any():
+            self.ball_x = np.where(vertical, np.where(low, radius, p["width"] - radius), self.ball_x)
+            self.ball_vx = np.where(vertical, -self.ball_vx, self.ball_vx)
+            self._bounce(vertical)
+
+        low = self.ball_y - radius <= 0
+        horizontal = moving & (low | (self.ball_y + radius >= p["height"]))
+        if horizontal.any():
+            self.ball_y = np.where(horizontal, np.where(low, radius, p["height"] - radius), self.ball_y)
+            self.ball_vy = np.where(horizontal, -self.ball_vy, self.ball_vy)
+            self._bounce(horizontal)
+
+        bounced = vertical | horizontal
+        accelerate = bounced & (self.speed < p["max_speed"])
+        self.speed = np.where(accelerate, np.minimum(self.speed + p["speed_increment"], p["max_speed"]), self.speed)
+        self.bounces += bounced
+
+    def _move_player(self, alive):
+        p = self.params
+        self.attack_cooldown -= alive & (self.attack_cooldown > 0)
+        animating = alive & (self.attack_animation > 0)
+        self.attack_animation -= animating
+        self.attacking &= ~(animating & (self.attack_animation <= 0))
+
+        self.player_vy = np.where(alive & ~self.on_ground, self.player_vy + p["gravity"], self.player_vy)
+        vx = np.where(alive, self.player_vx * p["friction"], self.player_vx)
+        vx[alive & (np.abs(vx) < 0.1)] = 0.0
+
+        x = np.where(alive, self.player_x + vx, self.player_x)
+        y = np.where(alive, self.player_y + self.player_vy, self.player_y)
+
+        grounded = alive & (y >= p["ground_y"])
+        y[grounded] = p["ground_y"]
+        self.player_vy[grounded] = 0.0
+        self.on_ground = np.where(alive, grounded, self.on_ground)
+
+        lo = p["wall_margin"]
+        hi = p["width"] - p["wall_margin"]
+        clamp = alive & ((x < lo) | (x > hi))
+        x = np.where(clamp, np.clip(x, lo, hi), x)
+        vx[clamp] = 0.0
+
+        self.player_x = x
+        self.player_y = y
+        self.player_vx = vx
+
+    def _check_collision(self, alive):
+        p = self.params
+        dx = self.ball_x - self.player_x
+        dy = self.ball_y - self.player_y
+        hit = alive & (self.invulnerable <= 0) & (np.sqrt(dx * dx + dy * dy) < p["ball_radius"] + p["player_radius"])
+        self.health -= hit
+        self.invulnerable[hit] = p["invulnerable_time"]
+        self.game_over |= hit & (self.health <= 0)
+
+def random_inputs(count, ticks, seed=0):
+    """生成 ticks×count 的随机按键矩阵，用于等价性校验"""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 16, size=(ticks, count), dtype=np.int32)
+
+def check_equivalence(count=64, ticks=3600, seed=0, params=None, tolerance=1e-6):
+    """用相同种子和输入运行两种实现，返回不一致的游戏下标列表"""
+    inputs = random_inputs(count, ticks, seed)
+    seeds = np.arange(seed, seed + count)
+    vector = VectorGames(count, params, seeds)
+    scalars = [ScalarGame(params, int(s)) for s in seeds]
+    for row in inputs:
+        vector.step(row)
+        for game, keys in zip(scalars, row):
+            game.step(int(keys))
+
+    mismatched = []
+    for i, game in enumerate(scalars):
+        same = (
+            game.game_over == vector.game_over[i]
+            and game.ticks == vector.ticks[i]
+            and game.health == vector.health[i]
+            and game.bounces == vector.bounces[i]
+            and all(abs(getattr(game, f) - getattr(vector, f)[i]) <= tolerance for f in VectorGames.FIELDS)
+        )
+        if not same:
+            mismatched.append(i)
+    return mismatched
+
+def main(argv=None):
+    """命令行：校验两种实现一致并测量向量化吞吐量"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Super Ball headless physics engine")
+    parser.add_argument("--games", type=int, default=10000, help="并行模拟的游戏局数")
+    parser.add_argument("--ticks", type=int, default=3600, help="每局最多模拟的帧数")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check", type=int, default=64, help="参与等价性校验的局数（0 跳过）")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        mismatched = check_equivalence(args.check, min(args.ticks, 3600), args.seed)
+        print(f"等价性校验: {args.check - len(mismatched)}/{args.check} 局一致")
+        if mismatched:
+            print(f"不一致的游戏: {mismatched[:10]}")
+            return 1
+
+    inputs = random_inputs(args.games, args.ticks, args.seed)
+    games = VectorGames(args.games, seeds=np.arange(args.seed, args.seed + args.games))
+    start = time.perf_counter()
+    for row in inputs:
+        if games.game_over.all():
+            break
+        games.step(row)
+    elapsed = time.perf_counter() - start
+    steps = int(games.ticks.sum())
+    print(f"{args.games} 局, {steps} 帧, 耗时 {elapsed:.2f}s ({steps / elapsed:,.0f} 帧/秒)")
+    print(f"存活到最后: {int((~games.game_over).sum())} 局, 平均存活 {games.ticks.mean() / TICKS_PER_SECOND:.1f}s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Super Ball 帧性能轨迹分析
+
+读取游戏内帧分析器（按 P 开启，按 E 导出）导出的 JSON 轨迹，汇总每个阶段的
+耗时分布，并指出超出帧预算的帧主要耗在哪个阶段。
+
+示例:
+    python trace_report.py superball-trace-1700000000000.json
+    python trace_report.py trace.json --budget 33.3 --json
+"""
+import argparse
+import json
+import sys
+
+def percentile(sorted_values, q):
+    """最近秩百分位数（与游戏内叠加层的算法一致）"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+def load_trace(path):
+    """加载并检查轨迹文件"""
+    with open(path, 'r', encoding='utf-8') as f:
+        trace = json.load(f)
+    if trace.get("format") != "superball-trace":
+        raise ValueError(f"不是 Super Ball 轨迹文件: {path}")
+    frames = trace["frames"]
+    count = len(frames["total"])
+    for name in ["start"] + trace["phases"]:
+        if len(frames.get(name, ())) != count:
+            raise ValueError(f"轨迹列长度不一致: {name}")
+    return trace
+
+def summarize(trace, budget_ms=None):
+    """计算阶段耗时分布、帧率和超预算帧的归因"""
+    frames = trace["frames"]
+    phases = trace["phases"]
+    budget = budget_ms if budget_ms is not None else trace.get("budgetMs", 1000 / 60)
+    totals = frames["total"]
+    count = len(totals)
+    starts = frames["start"]
+    elapsed = starts[-1] - starts[0] if count > 1 else 0.0
+    mean_total = sum(totals) / count if count else 0.0
+
+    def distribution(values):
+        ordered = sorted(values)
+        return {
+            "mean": sum(values) / len(values) if values else 0.0,
+            "p50": percentile(ordered, 0.50),
+            "p95": percentile(ordered, 0.95),
+            "p99": percentile(ordered, 0.99),
+            "max": ordered[-1] if ordered else 0.0,
+        }
+
+    phase_stats = {}
+    for name in phases:
+        stats = distribution(frames[name])
+        stats["share"] = stats["mean"] / mean_total if mean_total else 0.0
+        phase_stats[name] = stats
+
+    # 超预算帧：统计每帧中耗时最多的阶段
+    blame = {name: 0 for name in phases}
+    over_budget = 0
+    for i, total in enumerate(totals):
+        if total > budget:
+            over_budget += 1
+            worst = max(phases, key=lambda name: frames[name][i])
+            blame[worst] += 1
+
+    return {
+        "frames": count,
+        "budget_ms": budget,
+        "fps": (count - 1) * 1000 / elapsed if elapsed > 0 else 0.0,
+        "frame": distribution(totals),
+        "over_budget": over_budget,
+        "phases": phase_stats,
+        "blame": {name: n for name, n in blame.items() if n},
+        "user_agent": trace.get("userAgent", ""),
+    }
+
+def format_report(summary):
+    """把汇总结果格式化为文本"""
+    frame = summary["frame"]
+    lines = [
+        f"frames: {summary['frames']}  fps: {summary['fps']:.1f}  budget: {summary['budget_ms']:.1f} ms",
+        f"frame time  mean {frame['mean']:.3f}  p50 {frame['p50']:.3f}  p95 {frame['p95']:.3f}  "
+        f"p99 {frame['p99']:.3f}  max {frame['max']:.3f} ms",
+        f"over budget: {summary['over_budget']}/{summary['frames']}",
+        "",
+        f"{'phase':<14} {'mean':>8} {'p95':>8} {'p99':>8} {'max':>8} {'share':>7}",
+    ]
+    for name, stats in summary["phases"].items():
+        lines.append(
+            f"{name:<14} {stats['mean']:8.3f} {stats['p95']:8.3f} {stats['p99']:8.3f} "
+            f"{stats['max']:8.3f} {stats['share']:7.1%}"
+        )
+    if summary["blame"]:
+        lines.append("")
+        lines.append("slowest phase in over-budget frames:")
+        for name, n in sorted(summary["blame"].items(), key=lambda item: -item[1]):
+            lines.append(f"  {name:<14} {n}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize a Super Ball frame profiler trace")
+    parser.add_argument("trace", help="游戏导出的轨迹JSON文件")
+    parser.add_argument("--budget", type=float, help="帧预算（毫秒），默认取轨迹中的值")
+    parser.add_argument("--json", action="store_true", help="以JSON输出")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = summarize(load_trace(args.trace), args.budget)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"读取轨迹失败: {e}")
+        return 1
+    if args.json:
+        print(json.dumps(summary, indent=4, ensure_ascii=False))
+    else:
+        print(format_report(summary))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())